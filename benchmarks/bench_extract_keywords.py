@@ -0,0 +1,72 @@
+"""
+Compare the keyword throughput of the original `extract_keywords` with the
+streaming `iter_keywords` on long job descriptions.
+
+Run from the repository root with `python -m benchmarks.bench_extract_keywords`.
+"""
+import statistics
+import time
+
+from nltk.corpus import stopwords
+from nltk.tokenize import word_tokenize
+from nltk.util import ngrams
+
+from scripts.powerExtract import iter_keywords
+
+PARAGRAPH = (
+    "We are looking for a Senior Data Scientist to join our analytics team. You will "
+    "design and deploy machine learning models, build data pipelines with Python, SQL "
+    "and Spark, and work closely with product managers and engineers to turn business "
+    "questions into measurable experiments. Experience with deep learning frameworks "
+    "such as TensorFlow or PyTorch, cloud platforms like AWS or GCP, and strong "
+    "communication skills are required. "
+)
+
+
+def legacy_extract_keywords(text):
+    """The original implementation: a new stopword set per call and a scan of
+    every stopword per n-gram."""
+    stop_words = set(stopwords.words('english'))
+    words = word_tokenize(text.lower())
+    filtered_words = [word for word in words if word not in stop_words and word.isalnum()]
+    bigrams = [' '.join(gram) for gram in ngrams(filtered_words, 2) if not any(stop in gram for stop in stop_words)]
+    trigrams = [' '.join(gram) for gram in ngrams(filtered_words, 3) if not any(stop in gram for stop in stop_words)]
+    return filtered_words + bigrams + trigrams
+
+
+def streaming_extract_keywords(text):
+    return list(iter_keywords(text))
+
+
+def time_calls(function, text, runs):
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function(text)
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def report(name, timings, text):
+    mean = statistics.mean(timings)
+    print(
+        f"{name:<18} mean {mean * 1000:9.1f} ms   "
+        f"{len(text) / mean / 1e6:7.2f} MB/s"
+    )
+
+
+def main(runs=5):
+    for paragraphs in (10, 100, 1000):
+        text = PARAGRAPH * paragraphs
+        print(f"job description of {len(text):,} characters")
+        legacy_timings, legacy_result = time_calls(legacy_extract_keywords, text, runs)
+        streaming_timings, streaming_result = time_calls(streaming_extract_keywords, text, runs)
+        report("extract_keywords", legacy_timings, text)
+        report("iter_keywords", streaming_timings, text)
+        print(f"speedup            {statistics.mean(legacy_timings) / statistics.mean(streaming_timings):.1f}x")
+        print(f"identical output   {legacy_result == streaming_result}")
+
+
+if __name__ == "__main__":
+    main()
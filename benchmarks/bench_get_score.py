@@ -0,0 +1,62 @@
+"""
+Compare the latency of the original per-call `get_score` with the shared
+EmbeddingScorer.
+
+Run from the repository root with `python -m benchmarks.bench_get_score`.
+"""
+import statistics
+import time
+
+from qdrant_client import QdrantClient
+
+from scripts.similarity.embedding_scorer import get_embedding_scorer
+
+RESUME = (
+    "python sql machine learning deep learning tensorflow pytorch pandas numpy "
+    "data visualization tableau statistics nlp computer vision docker aws"
+)
+JOB_DESCRIPTION = (
+    "machine learning deep learning nlp computer vision predictive modeling "
+    "statistics data visualization python sql"
+)
+
+
+def legacy_get_score(resume_string, job_description_string):
+    """The original implementation: a new client and model load per call."""
+    client = QdrantClient(":memory:")
+    client.set_model("BAAI/bge-base-en")
+    client.add(collection_name="demo_collection", documents=[resume_string])
+    return client.query(collection_name="demo_collection", query_text=job_description_string)
+
+
+def time_calls(function, runs):
+    timings = []
+    result = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = function(RESUME, JOB_DESCRIPTION)
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def report(name, timings):
+    print(
+        f"{name:<16} mean {statistics.mean(timings) * 1000:9.1f} ms   "
+        f"median {statistics.median(timings) * 1000:9.1f} ms   "
+        f"max {max(timings) * 1000:9.1f} ms"
+    )
+
+
+def main(runs=10):
+    legacy_timings, legacy_result = time_calls(legacy_get_score, runs)
+    scorer = get_embedding_scorer()
+    warm_timings, warm_result = time_calls(scorer.score_pair, runs)
+
+    report("legacy get_score", legacy_timings)
+    report("EmbeddingScorer", warm_timings)
+    print(f"speedup          {statistics.mean(legacy_timings) / statistics.mean(warm_timings):.1f}x")
+    print(f"scores           {legacy_result[0].score:.6f} vs {warm_result[0].score:.6f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare the latency of a linear `process.extract` over every title with the
+TitleIndex lookup on a synthetic catalog of 50k job titles.
+
+Run from the repository root with `python -m benchmarks.bench_title_index`.
+"""
+import random
+import statistics
+import string
+import time
+
+from fuzzywuzzy import process
+
+from scripts.taxonomy import TitleIndex
+
+WORDS = [
+    "senior", "junior", "lead", "principal", "data", "software", "security", "network",
+    "cloud", "devops", "machine", "learning", "engineer", "analyst", "scientist", "manager",
+    "developer", "architect", "intern", "specialist", "consultant", "administrator", "sales",
+    "marketing", "finance", "nurse", "teacher", "technician", "operator", "designer",
+    "product", "research", "quality", "assurance", "support", "customer", "operations",
+    "director", "assistant", "coordinator",
+]
+QUERIES = [
+    "data scientist",
+    "senior software engineer",
+    "network security analyst",
+    "product manager",
+    "registered nurse",
+    "cloud devops architect",
+]
+
+
+def build_titles(count, seed=0):
+    rng = random.Random(seed)
+    titles = {}
+    while len(titles) < count:
+        words = " ".join(rng.sample(WORDS, rng.randint(2, 4))).title()
+        titles[f"{words} {''.join(rng.choices(string.ascii_uppercase, k=3))}"] = None
+    return list(titles)
+
+
+def time_queries(function, runs):
+    timings = []
+    for _ in range(runs):
+        for query in QUERIES:
+            start = time.perf_counter()
+            function(query)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def report(name, timings):
+    print(
+        f"{name:<16} mean {statistics.mean(timings) * 1000:9.3f} ms   "
+        f"median {statistics.median(timings) * 1000:9.3f} ms   "
+        f"max {max(timings) * 1000:9.3f} ms"
+    )
+
+
+def main(count=50_000, runs=20):
+    titles = build_titles(count)
+    choices = dict(enumerate(titles))
+    start = time.perf_counter()
+    index = TitleIndex(titles)
+    print(f"built index over {len(titles):,} titles in {time.perf_counter() - start:.2f} s")
+
+    report("process.extract", time_queries(lambda query: process.extract(query, choices, limit=3), 1))
+    report("TitleIndex", time_queries(lambda query: index.search(query, limit=3), runs))
+
+
+if __name__ == "__main__":
+    main()
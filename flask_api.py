@@ -1,18 +1,22 @@
+import io
 import os
+import collections
 import json
-import docx
-import uuid
+import tarfile
+import zipfile
 import nltk
 import pandas as pd
 from typing import List
-from pypdf import PdfReader
 from annotated_text import parameters
-from scripts.similarity.get_score import get_score
-from scripts.parsers import ParseJobDesc, ParseResume
-from scripts.powerExtract import ResumeJobMatchingSystem
-from flask import Flask, request, jsonify
-
-app = Flask(__name__)
+from scripts import ScoringPipeline
+from scripts.utils.JobQueue import JobQueue, JobWorkerPool, QueueFull
+from scripts.utils.ModelRegistry import get_model_stats
+from scripts.utils.ParseCache import ParseCache
+from scripts.utils.ProcessPool import DeadlineExceeded, PoolSaturated, PoolUnavailable, WarmProcessPool
+from scripts.utils.Uploads import UploadTooLarge, persist_uploads, spool_upload
+from scripts.utils.Utils import hash_bytes
+from flask import Blueprint, Flask, Response, current_app, request, jsonify, stream_with_context
+from werkzeug.exceptions import RequestEntityTooLarge
 
 # Initialize logging and configuration
 from scripts.utils.logger import init_logging_config
@@ -26,90 +30,380 @@ except LookupError:
 
 # Helper functions
 # ... (include your helper functions here) ...
-def read_document(file_path, file_type):
-    if file_type == 'pdf':
-        return read_pdf(file_path)
-    elif file_type == 'docx':
-        return read_docx(file_path)
-    else:
-        raise ValueError("Unsupported file type for document reading.")
+RESUME_TYPES = {'.pdf': 'pdf', '.docx': 'docx'}
+# The largest resume /score_resume and /jobs accept
+MAX_RESUME_BYTES = int(os.environ.get('MAX_RESUME_BYTES', 10 * 1024 * 1024))
 
-def read_pdf(file_path):
-    text_output = []
-    try:
-        with open(file_path, "rb") as file:
-            pdf_reader = PdfReader(file)
-            text_output = [page.extract_text() for page in pdf_reader.pages if page.extract_text()]
-    except Exception as e:
-        print(f"Failed to read PDF file: {str(e)}")
-    return " ".join(text_output)
+api = Blueprint('api', __name__)
 
-def read_docx(file_path):
-    text_output = []
-    try:
-        doc = docx.Document(file_path)
-        text_output = [para.text for para in doc.paragraphs if para.text]
-    except Exception as e:
-        print(f"Failed to read DOCX file: {str(e)}")
-    return " ".join(text_output)
+@api.route('/ready', methods=['GET'])
+def ready():
+    score_pool = current_app.extensions['score_pool'].status()
+    is_ready = ScoringPipeline.is_ready() and score_pool['error'] is None
+    body = {'ready': is_ready, 'models': get_model_stats(), 'score_pool': score_pool}
+    return jsonify(body), 200 if is_ready else 503
 
-@app.route('/score_resume', methods=['POST'])
+@api.route('/score_resume', methods=['POST'])
 def score_resume():
     try:
         # Get data from the request
-        data = request.get_json()
-        company_name = data.get('company_name')
-        job_title = data.get('job_title')
-        resume_file = data.get('resume_file')
-        job_description_text = data.get('job_description_text')
+        company_name, job_title, resume_file, job_description_text = get_upload_fields()
 
         if not all([company_name, job_title, resume_file, job_description_text]):
             return jsonify({'error': 'Missing required fields'}), 400
+        if not is_upload(resume_file):
+            return jsonify({'error': 'resume_file must be uploaded as a file'}), 400
+
+        resume_bytes = read_upload(resume_file)
+        file_type = get_file_type(resume_file)
 
-        # Save the resume file
-        unique_id = uuid.uuid4().hex
-        resume_filename = f"{unique_id}_resume.pdf"  # Assuming PDF format
-        resume_path = os.path.join("data/Resumes", resume_filename)
-        with open(resume_path, "wb") as f:
-            f.write(resume_file.read())
-
-        # Save the job description text
-        jobdesc_filename = f"{unique_id}_jobdesc.txt"
-        job_desc_path = os.path.join("data/JobDescription", jobdesc_filename)
-        with open(job_desc_path, "w") as f:
-            f.write(job_description_text)
-
-        # Read and parse the documents
-        resume_text = read_document(resume_path, 'pdf')
-        resume_data = ParseResume(resume_text).get_JSON()
-        job_desc_data = ParseJobDesc(job_description_text).get_JSON()
-
-        DescRes = ResumeJobMatchingSystem("data/job_skills.json", "data/job_skills.csv")
-        if DescRes.df is not None:
-            job_title = job_title.lower()
-            resume_text = resume_text.lower()
-            job_description_text = job_description_text.lower()
-            resume_keywords = DescRes.extract_keywords(resume_text)
-            job_keywords = DescRes.extract_keywords(job_description_text)
-            matches = DescRes.find_job_title_matches(job_title)
-            resume_optimized_keywords = DescRes.optimize_keywords(matches, resume_keywords)
-            job_optimized_keywords = DescRes.optimize_keywords(matches, job_keywords)
-            resume_advanced_key_words = DescRes.process_keywords(resume_optimized_keywords, matches)
-            job_advanced_key_words = DescRes.process_keywords(job_optimized_keywords, matches)
-
-            # Similarity scoring
-            resume_advanced_key_words = " ".join(resume_advanced_key_words)
-            job_advanced_key_words = " ".join(job_advanced_key_words)
-            result = get_score(resume_advanced_key_words, job_advanced_key_words)
-            similarity_score = round(result[0].score * 100, 2)
-
-            # Return the similarity score
-            return jsonify({'similarity_score': similarity_score})
-        else:
+        # Keep a copy of the upload only if PERSIST_UPLOADS is set
+        persist_uploads(resume_bytes, f".{file_type}", job_description_text)
+
+        # Parse, extract keywords and score in a scoring process
+        similarity_score = current_app.extensions['score_pool'].run(
+            ScoringPipeline.score_resume_bytes,
+            resume_bytes,
+            job_description_text,
+            job_title,
+            current_app.extensions['parse_cache'],
+            file_type,
+        )
+        if similarity_score is None:
             return jsonify({'error': 'Failed to load job skills data'}), 500
 
+        # Return the similarity score
+        return jsonify({'similarity_score': similarity_score})
+
+    except (UploadTooLarge, RequestEntityTooLarge) as e:
+        return upload_too_large(e)
+    except PoolSaturated:
+        response = jsonify({'error': 'Too many pending requests, retry later'})
+        response.headers['Retry-After'] = '1'
+        return response, 429
+    except PoolUnavailable as e:
+        return jsonify({'error': str(e)}), 503
+    except DeadlineExceeded as e:
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def get_upload_fields():
+    # A multipart form with the resume as a file, or the same fields as JSON
+    if request.files:
+        resume_file = request.files.get('resume_file')
+        fields = request.form
+    else:
+        fields = request.get_json(silent=True) or {}
+        resume_file = fields.get('resume_file')
+    return (
+        fields.get('company_name'),
+        fields.get('job_title'),
+        resume_file,
+        fields.get('job_description_text'),
+    )
+
+def is_upload(resume_file):
+    # JSON can only carry the other fields; a string is not a file
+    return hasattr(resume_file, 'stream')
+
+def read_upload(resume_file):
+    # Copied in chunks, so an oversized resume is refused as soon as it is
+    # found to be, rather than once it is in memory
+    spool, _ = spool_upload(resume_file.stream, limit=MAX_RESUME_BYTES)
+    with spool:
+        return spool.read()
+
+@api.app_errorhandler(RequestEntityTooLarge)
+def upload_too_large(e):
+    if isinstance(e, RequestEntityTooLarge):
+        e = f'The request is larger than {current_app.config["MAX_CONTENT_LENGTH"]} bytes'
+    return jsonify({'error': str(e)}), 413
+
+def get_file_type(resume_file):
+    # Uploads without a known extension are read as PDF
+    filename = getattr(resume_file, 'filename', None) or ''
+    return RESUME_TYPES.get(os.path.splitext(filename)[1].lower(), 'pdf')
+
+def score_job(payload, data):
+    """
+    Score a resume submitted through `POST /jobs`. Runs on a job worker.
+
+    Args:
+        payload (dict): The job title and job description text.
+        data (bytes): The uploaded resume.
+
+    Returns:
+        dict: The similarity score.
+    """
+    similarity_score = ScoringPipeline.score_resume_bytes(
+        data,
+        payload['job_description_text'],
+        payload['job_title'],
+        current_app.extensions['parse_cache'],
+        payload.get('file_type', 'pdf'),
+    )
+    if similarity_score is None:
+        raise RuntimeError('Failed to load job skills data')
+    return {'similarity_score': similarity_score}
+
+@api.route('/jobs', methods=['POST'])
+def submit_job():
+    company_name, job_title, resume_file, job_description_text = get_upload_fields()
+
+    if not all([company_name, job_title, resume_file, job_description_text]):
+        return jsonify({'error': 'Missing required fields'}), 400
+    if not is_upload(resume_file):
+        return jsonify({'error': 'resume_file must be uploaded as a file'}), 400
+    try:
+        resume_bytes = read_upload(resume_file)
+    except UploadTooLarge as e:
+        return upload_too_large(e)
+
+    queue = current_app.extensions['job_queue']
+    pool = current_app.extensions['job_pool']
+    pool.ensure_started()
+    payload = {
+        'company_name': company_name,
+        'job_title': job_title,
+        'job_description_text': job_description_text,
+        'file_type': get_file_type(resume_file),
+    }
+    try:
+        job_id = queue.submit(payload, resume_bytes)
+    except QueueFull:
+        response = jsonify({'error': 'Too many pending jobs, retry later'})
+        response.headers['Retry-After'] = '5'
+        return response, 429
+    pool.notify()
+    return jsonify({'job_id': job_id, 'status': 'queued'}), 202
+
+@api.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    job = current_app.extensions['job_queue'].get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+    body = {'job_id': job['id'], 'status': job['status']}
+    if job['result'] is not None:
+        body.update(job['result'])
+    if job['error'] is not None:
+        body['error'] = job['error']
+    return jsonify(body)
+
+def _in_app_context(app, handler):
+    def run(payload, data):
+        with app.app_context():
+            return handler(payload, data)
+    return run
+
+RANK_MAX_RESUMES = int(os.environ.get('RANK_MAX_RESUMES', 1000))
+RANK_MAX_RESUME_BYTES = int(os.environ.get('RANK_MAX_RESUME_BYTES', 10 * 1024 * 1024))
+RANK_MAX_TOTAL_BYTES = int(os.environ.get('RANK_MAX_TOTAL_BYTES', 500 * 1024 * 1024))
+
+def iter_archive(archive_file):
+    """
+    Yield every file in a zip or tar archive, without extracting it to disk.
+
+    Args:
+        archive_file (FileStorage): The uploaded archive.
+
+    Returns:
+        generator: (filename, file) pairs. Each file is only readable until
+        the next pair is yielded.
+    """
+    stream = archive_file.stream
+    if zipfile.is_zipfile(stream):
+        stream.seek(0)
+        with zipfile.ZipFile(stream) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    with archive.open(info) as member:
+                        yield info.filename, member
+    else:
+        stream.seek(0)
+        with tarfile.open(fileobj=stream) as archive:
+            for member in archive:
+                if member.isfile():
+                    yield member.name, archive.extractfile(member)
+
+def iter_rank_uploads():
+    for resume_file in request.files.getlist('resumes'):
+        yield resume_file.filename, resume_file.stream
+    for archive_file in request.files.getlist('archive'):
+        for name, member in iter_archive(archive_file):
+            if (os.path.splitext(name)[1].lower() in RESUME_TYPES
+                    and not os.path.basename(name).startswith('.')
+                    and '__MACOSX' not in name):
+                yield name, member
+
+def spool_rank_resumes(resumes):
+    """
+    Spool every uploaded resume, so only large ones are held on disk.
+
+    Args:
+        resumes (list): Filled with (filename, spool, hash) triples, which
+            the caller closes even if spooling fails.
+
+    Raises:
+        UploadTooLarge: As soon as there are more than RANK_MAX_RESUMES
+            resumes, or one of them is larger than RANK_MAX_RESUME_BYTES, or
+            all of them are larger than RANK_MAX_TOTAL_BYTES.
+    """
+    total_size = 0
+    for name, stream in iter_rank_uploads():
+        if len(resumes) == RANK_MAX_RESUMES:
+            raise UploadTooLarge(f'At most {RANK_MAX_RESUMES} resumes can be ranked at once')
+        limit = min(RANK_MAX_RESUME_BYTES, RANK_MAX_TOTAL_BYTES - total_size)
+        try:
+            spool, resume_hash = spool_upload(stream, limit=limit)
+        except UploadTooLarge:
+            if limit == RANK_MAX_RESUME_BYTES:
+                raise UploadTooLarge(f'{name} is larger than {RANK_MAX_RESUME_BYTES} bytes') from None
+            raise UploadTooLarge(f'The resumes are larger than {RANK_MAX_TOTAL_BYTES} bytes in total') from None
+        resumes.append((name, spool, resume_hash))
+        total_size += spool.seek(0, os.SEEK_END)
+        spool.seek(0)
+
+@api.route('/rank', methods=['POST'])
+def rank():
+    job_title = request.form.get('job_title')
+    job_description_text = request.form.get('job_description_text')
+    if not all([job_title, job_description_text]):
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    resumes = []
+
+    def close_resumes():
+        for _, spool, _ in resumes:
+            spool.close()
+
+    try:
+        spool_rank_resumes(resumes)
+    except (zipfile.BadZipFile, tarfile.TarError) as e:
+        close_resumes()
+        return jsonify({'error': f'Unreadable archive: {str(e)}'}), 400
+    except UploadTooLarge as e:
+        close_resumes()
+        return jsonify({'error': str(e)}), 413
+    if not resumes:
+        return jsonify({'error': 'No resumes uploaded'}), 400
+
+    # The job description is parsed and matched to job titles once
+    parse_cache = current_app.extensions['parse_cache']
+    job = ScoringPipeline.prepare_job(job_description_text, job_title, parse_cache=parse_cache)
+    if job is None:
+        close_resumes()
+        return jsonify({'error': 'Failed to load job skills data'}), 500
+
+    score_pool = current_app.extensions['score_pool']
+
+    def submit(index, filename, spool, resume_hash):
+        line = {'index': index, 'filename': filename}
+        file_type = RESUME_TYPES.get(os.path.splitext(filename)[1].lower())
+        try:
+            if file_type is None:
+                raise ValueError("Unsupported file type for document reading.")
+            # Other requests may hold every slot; wait for one rather than
+            # leave the resume out of the ranking
+            future = score_pool.submit(
+                ScoringPipeline.score_prepared_bytes, job, resume_hash, spool.read(), file_type, parse_cache,
+                admission_timeout=score_pool.timeout,
+            )
+        except Exception as e:
+            line['error'] = str(e)
+            future = None
+        finally:
+            spool.close()
+        return line, future
+
+    scored = []
+    pending = collections.deque()
+
+    def finish():
+        line, future = pending.popleft()
+        if future is not None:
+            try:
+                line['similarity_score'] = score_pool.wait(future)
+                scored.append(line)
+            except Exception as e:
+                line['error'] = str(e)
+        return json.dumps(line) + '\n'
+
+    def generate():
+        # Resumes are scored in the pool, as many at a time as it has
+        # processes, and streamed back in upload order
+        try:
+            for index, (filename, spool, resume_hash) in enumerate(resumes):
+                pending.append(submit(index, filename, spool, resume_hash))
+                if len(pending) >= score_pool.workers:
+                    yield finish()
+            while pending:
+                yield finish()
+        finally:
+            for _, future in pending:
+                if future is not None:
+                    future.cancel()
+            close_resumes()
+        ranking = sorted(scored, key=lambda line: line['similarity_score'], reverse=True)
+        yield json.dumps({'ranking': ranking}) + '\n'
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+def create_app(preload=True, start_workers=True):
+    """
+    Create the Flask application.
+
+    With `preload`, every model is loaded before the app is returned. With
+    `start_workers`, the job workers start at once, so jobs left in the
+    queue by a previous run are picked up without waiting for a new one.
+
+    Run a multi-worker server with the app created in the master process,
+    so the forked workers share the loaded models copy-on-write. The
+    master must not start the job workers itself; gunicorn.conf.py starts
+    them in every worker after the fork:
+    `gunicorn -c gunicorn.conf.py "flask_api:create_app(start_workers=False)"`.
+
+    The scoring processes are started with `start_workers` too, and by
+    gunicorn.conf.py in every worker. Each scoring process loads its own
+    copy of the models, the taxonomy, the skill matcher and the embedding
+    model, so a server holds web workers x SCORE_WORKERS copies on top of
+    the shared one. SCORE_WORKERS defaults to the CPUs divided by
+    WEB_CONCURRENCY, at most two. If the scoring processes fail to start,
+    `/ready` reports the error and `/score_resume` answers 503 until the
+    server is restarted.
+    """
+    app = Flask(__name__)
+    # Request bodies are refused above this size. It allows /rank to be sent
+    # up to RANK_MAX_TOTAL_BYTES of resumes; single resumes are limited to
+    # MAX_RESUME_BYTES as they are read.
+    app.config['MAX_CONTENT_LENGTH'] = int(
+        os.environ.get('MAX_REQUEST_BYTES', RANK_MAX_TOTAL_BYTES + 1024 * 1024)
+    )
+    # Parse results shared by every worker process, keyed by document content
+    app.extensions['parse_cache'] = ParseCache()
+    # Jobs submitted through POST /jobs, run by a few threads per worker process
+    job_queue = JobQueue()
+    app.extensions['job_queue'] = job_queue
+    app.extensions['job_pool'] = JobWorkerPool(
+        job_queue, _in_app_context(app, score_job), workers=int(os.environ.get('JOB_WORKERS', 2))
+    )
+    # Synchronous /score_resume requests run in a pool of scoring processes,
+    # one pool per worker process
+    app.extensions['score_pool'] = WarmProcessPool(initializer=ScoringPipeline.preload)
+    app.register_blueprint(api)
+    if preload:
+        ScoringPipeline.preload()
+    if start_workers:
+        app.extensions['job_pool'].ensure_started()
+        start_score_pool(app)
+    return app
+
+def start_score_pool(app):
+    try:
+        app.extensions['score_pool'].ensure_started()
+    except PoolUnavailable:
+        # Recorded by the pool and reported by /ready
+        pass
+
 if __name__ == '__main__':
-    app.run(debug=True)
\ No newline at end of file
+    create_app().run(debug=True)
@@ -0,0 +1,16 @@
+# Run with: gunicorn -c gunicorn.conf.py "flask_api:create_app(start_workers=False)"
+
+# Load the models once in the master; the forked workers share them
+preload_app = True
+
+# Every worker also starts SCORE_WORKERS scoring processes, each with its own
+# copy of the models: plan memory for workers x SCORE_WORKERS model copies.
+# Set the worker count with WEB_CONCURRENCY so the default SCORE_WORKERS
+# divides the CPUs between the workers.
+
+def post_worker_init(worker):
+    # Start the job workers and scoring processes in each worker process,
+    # after the fork
+    from flask_api import start_score_pool
+    worker.wsgi.extensions['job_pool'].ensure_started()
+    start_score_pool(worker.wsgi)
@@ -1,12 +1,22 @@
+import argparse
 import json
 import logging
 import os
 
-from scripts import JobDescriptionProcessor, ResumeProcessor
-from scripts.utils import get_filenames_from_dir, init_logging_config
+from scripts import BatchProcessor, JobDescriptionProcessor, ResumeProcessor
+from scripts.utils import IngestManifest, get_filenames_from_dir, init_logging_config
 
 init_logging_config()
 
+parser = argparse.ArgumentParser(description="Parse resumes and job descriptions into JSON.")
+parser.add_argument("--batch", action="store_true", help="Stream documents through nlp.pipe in batches.")
+parser.add_argument("--batch-size", type=int, default=32, help="Documents per nlp.pipe batch and per worker chunk.")
+parser.add_argument("--n-process", type=int, default=1, help="Processes used by nlp.pipe inside each worker.")
+parser.add_argument("--workers", type=int, default=1, help="Worker processes used in batch mode.")
+parser.add_argument("--full", action="store_true", help="Discard previous outputs and reprocess every file.")
+parser.add_argument("--index", action="store_true", help="Sync the persistent resume vector index afterwards.")
+args = parser.parse_args()
+
 PROCESSED_RESUMES_PATH = "/data/Processed/Resumes"
 PROCESSED_JOB_DESCRIPTIONS_PATH = "/data/Processed/JobDescription"
 
@@ -29,11 +39,49 @@ def remove_old_files(files_path):
     logging.info("Deleted old files from " + files_path)
 
 
+def ingest(file_names, processor_class, document_type):
+    """
+    Parse only the new or changed files and drop the outputs of deleted ones.
+    """
+    manifest = IngestManifest(processor_class.save_directory)
+    if args.full:
+        manifest.clear()
+    sources = {name: processor_class(name).input_file_name for name in file_names}
+    to_process, deleted = manifest.plan(sources)
+    for name in deleted:
+        manifest.drop(name)
+    logging.info(
+        f"{len(to_process)} new or changed, {len(deleted)} deleted, "
+        f"{len(sources) - len(to_process)} unchanged {document_type} files."
+    )
+
+    if args.batch:
+        saved = BatchProcessor(
+            list(to_process),
+            document_type=document_type,
+            batch_size=args.batch_size,
+            n_process=args.n_process,
+            workers=args.workers,
+            unique_ids=to_process,
+        ).process()
+    else:
+        saved = []
+        for name, unique_id in to_process.items():
+            processor = processor_class(name, unique_id=unique_id)
+            if processor.process():
+                saved.append((name, processor.output_file))
+
+    for name, output_file in saved:
+        manifest.record(name, to_process[name], output_file)
+    manifest.save()
+
+
 logging.info("Started to read from data/Resumes")
 try:
     # Check if there are resumes present or not.
     # If present then parse it.
-    remove_old_files(PROCESSED_RESUMES_PATH)
+    if args.full:
+        remove_old_files(PROCESSED_RESUMES_PATH)
 
     file_names = get_filenames_from_dir("/data/Resumes")
     logging.info("Reading from Data/Resumes is now complete.")
@@ -46,16 +94,15 @@ except:
 
 # Now after getting the file_names parse the resumes into a JSON Format.
 logging.info("Started parsing the resumes.")
-for file in file_names:
-    processor = ResumeProcessor(file)
-    success = processor.process()
+ingest(file_names, ResumeProcessor, "resume")
 logging.info("Parsing of the resumes is now complete.")
 
 logging.info("Started to read from Data/JobDescription")
 try:
     # Check if there are resumes present or not.
     # If present then parse it.
-    remove_old_files(PROCESSED_JOB_DESCRIPTIONS_PATH)
+    if args.full:
+        remove_old_files(PROCESSED_JOB_DESCRIPTIONS_PATH)
 
     file_names = get_filenames_from_dir("data/JobDescription")
     logging.info("Reading from Data/JobDescription is now complete.")
@@ -68,8 +115,15 @@ except:
 
 # Now after getting the file_names parse the resumes into a JSON Format.
 logging.info("Started parsing the Job Descriptions.")
-for file in file_names:
-    processor = JobDescriptionProcessor(file)
-    success = processor.process()
+ingest(file_names, JobDescriptionProcessor, "job_description")
 logging.info("Parsing of the Job Descriptions is now complete.")
+
+if args.index:
+    from scripts.similarity.resume_index import ResumeIndex
+
+    logging.info("Started syncing the resume index.")
+    resume_index = ResumeIndex()
+    resume_index.sync_directory(ResumeProcessor.save_directory)
+    resume_index.close()
+    logging.info("Syncing the resume index is now complete.")
 logging.info("Success now run `streamlit run streamlit_second.py`")
\ No newline at end of file
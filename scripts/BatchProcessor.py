@@ -0,0 +1,147 @@
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .JobDescriptionProcessor import JobDescriptionProcessor
+from .parsers import ParseContext, ParseJobDesc, ParseResume
+from .ReadPdf import read_single_pdf
+from .ResumeProcessor import ResumeProcessor
+
+DOCUMENT_TYPES = {
+    "resume": (ResumeProcessor, ParseResume),
+    "job_description": (JobDescriptionProcessor, ParseJobDesc),
+}
+
+
+def _process_chunk(input_files, document_type, batch_size, n_process, unique_ids) -> list:
+    """
+    Read, parse and save one chunk of documents.
+
+    Args:
+        input_files (list): The file names of the chunk.
+        document_type (str): Either "resume" or "job_description".
+        batch_size (int): The nlp.pipe batch size.
+        n_process (int): The number of processes used by nlp.pipe.
+        unique_ids (dict): Already known document IDs by file name.
+
+    Returns:
+        list: The (input file, output file) pairs saved successfully.
+    """
+    processor_class, parser_class = DOCUMENT_TYPES[document_type]
+    processors = [
+        processor_class(input_file, unique_id=unique_ids.get(input_file))
+        for input_file in input_files
+    ]
+    items = (
+        (read_single_pdf(processor.input_file_name), processor)
+        for processor in processors
+    )
+    saved = []
+    for context, processor in ParseContext.pipe(
+        items, batch_size=batch_size, n_process=n_process
+    ):
+        try:
+            output = parser_class(
+                context.raw_text, context=context, unique_id=processor.document_id()
+            ).get_JSON()
+            processor._write_json_file(output)
+            saved.append((processor.input_file, processor.output_file))
+        except Exception as e:
+            logging.error(f"Error processing {processor.input_file}: {e}")
+    return saved
+
+
+class BatchProcessor:
+    """
+    A class for parsing many documents at once, streaming them through
+    nlp.pipe and optionally spreading chunks over a pool of worker processes.
+    """
+
+    def __init__(
+        self,
+        input_files,
+        document_type: str = "resume",
+        batch_size: int = 32,
+        n_process: int = 1,
+        workers: int = 1,
+        unique_ids: dict = None,
+    ):
+        """
+        Initialize the BatchProcessor object.
+
+        Args:
+            input_files (list): The file names to process.
+            document_type (str): Either "resume" or "job_description".
+            batch_size (int): The number of documents per nlp.pipe batch and
+                per worker chunk.
+            n_process (int): The number of processes used by nlp.pipe inside
+                each worker.
+            workers (int): The number of worker processes. With a single
+                worker everything runs in the current process.
+            unique_ids (dict, optional): Already known document IDs by file
+                name, e.g. from an IngestManifest.
+        """
+        if document_type not in DOCUMENT_TYPES:
+            raise ValueError(f"Unsupported document type: {document_type}")
+        self.input_files = list(input_files)
+        self.document_type = document_type
+        self.batch_size = max(1, batch_size)
+        self.n_process = max(1, n_process)
+        self.workers = max(1, workers)
+        self.unique_ids = unique_ids or {}
+
+    def _chunks(self):
+        for start in range(0, len(self.input_files), self.batch_size):
+            chunk = self.input_files[start : start + self.batch_size]
+            unique_ids = {
+                name: self.unique_ids[name] for name in chunk if name in self.unique_ids
+            }
+            yield chunk, unique_ids
+
+    def _report_progress(self, done, saved, started):
+        elapsed = time.perf_counter() - started
+        rate = done / elapsed if elapsed > 0 else 0.0
+        logging.info(
+            f"Processed {done}/{len(self.input_files)} {self.document_type} files "
+            f"({saved} saved, {rate:.1f} docs/s)"
+        )
+
+    def process(self) -> list:
+        """
+        Process every input file.
+
+        Returns:
+            list: The (input file, output file) pairs saved successfully.
+        """
+        started = time.perf_counter()
+        done = 0
+        saved = []
+        if self.workers == 1:
+            for chunk, unique_ids in self._chunks():
+                saved += _process_chunk(
+                    chunk, self.document_type, self.batch_size, self.n_process, unique_ids
+                )
+                done += len(chunk)
+                self._report_progress(done, len(saved), started)
+            return saved
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    _process_chunk,
+                    chunk,
+                    self.document_type,
+                    self.batch_size,
+                    self.n_process,
+                    unique_ids,
+                ): len(chunk)
+                for chunk, unique_ids in self._chunks()
+            }
+            for future in as_completed(futures):
+                try:
+                    saved += future.result()
+                except Exception as e:
+                    logging.error(f"A worker failed to process its chunk: {e}")
+                done += futures[future]
+                self._report_progress(done, len(saved), started)
+        return saved
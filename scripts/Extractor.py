@@ -1,12 +1,7 @@
 import re
 import urllib.request
 
-import spacy
-
-from .utils import TextCleaner
-
-# Load the English model
-nlp = spacy.load("en_core_web_sm")
+from .utils import TextCleaner, get_nlp
 
 
 RESUME_SECTIONS = [
@@ -47,17 +42,23 @@ class DataExtractor:
     A class for extracting various types of data from text.
     """
 
-    def __init__(self, raw_text: str):
+    def __init__(self, raw_text: str, doc=None):
         """
         Initialize the DataExtractor object.
 
         Args:
             raw_text (str): The raw input text.
+            doc (Doc, optional): An already parsed document to reuse, e.g. from
+                a ParseContext. When omitted the text is cleaned and parsed here.
         """
 
         self.text = raw_text
-        self.clean_text = TextCleaner.clean_text(self.text)
-        self.doc = nlp(self.clean_text)
+        if doc is None:
+            self.clean_text = TextCleaner.clean_text(self.text)
+            self.doc = get_nlp("en_core_web_sm")(self.clean_text)
+        else:
+            self.clean_text = doc.text
+            self.doc = doc
 
     def extract_links(self):
         """
@@ -4,20 +4,30 @@ import pathlib
 
 from .parsers import ParseJobDesc, ParseResume
 from .ReadPdf import read_single_pdf
+from .utils.Utils import generate_document_id, hash_file
 
 READ_JOB_DESCRIPTION_FROM = "../data/JobDescription/"
 SAVE_DIRECTORY = "../data/Processed/JobDescription"
 
 
 class JobDescriptionProcessor:
-    def __init__(self, input_file):
+    save_directory = SAVE_DIRECTORY
+
+    def __init__(self, input_file, unique_id=None):
         self.input_file = input_file
         self.input_file_name = os.path.join(READ_JOB_DESCRIPTION_FROM + self.input_file)
+        self.unique_id = unique_id
+        self.output_file = None
+
+    def document_id(self) -> str:
+        if self.unique_id is None:
+            self.unique_id = generate_document_id(hash_file(self.input_file_name))
+        return self.unique_id
 
     def process(self) -> bool:
         try:
-            resume_dict = self._read_resumes()
-            self._write_json_file(resume_dict)
+            job_desc_dict = self._read_job_desc()
+            self._write_json_file(job_desc_dict)
             return True
         except Exception as e:
             print(f"An error occurred: {str(e)}")
@@ -25,12 +35,12 @@ class JobDescriptionProcessor:
 
     def _read_resumes(self) -> dict:
         data = read_single_pdf(self.input_file_name)
-        output = ParseResume(data).get_JSON()
+        output = ParseResume(data, unique_id=self.document_id()).get_JSON()
         return output
 
     def _read_job_desc(self) -> dict:
         data = read_single_pdf(self.input_file_name)
-        output = ParseJobDesc(data).get_JSON()
+        output = ParseJobDesc(data, unique_id=self.document_id()).get_JSON()
         return output
 
     def _write_json_file(self, resume_dictionary: dict):
@@ -41,6 +51,7 @@ class JobDescriptionProcessor:
             + ".json"
         )
         save_directory_name = pathlib.Path(SAVE_DIRECTORY) / file_name
+        self.output_file = file_name
         json_object = json.dumps(resume_dictionary, sort_keys=True, indent=14)
         with open(save_directory_name, "w+") as outfile:
             outfile.write(json_object)
@@ -1,22 +1,29 @@
 import textacy
 from textacy import extract
 
+from scripts.utils.ModelRegistry import get_nlp
+
 
 class KeytermExtractor:
     """
     A class for extracting keyterms from a given text using various algorithms.
     """
 
-    def __init__(self, raw_text: str, top_n_values: int = 20):
+    def __init__(self, raw_text: str, top_n_values: int = 20, text_doc=None):
         """
         Initialize the KeytermExtractor object.
 
         Args:
             raw_text (str): The raw input text.
             top_n_values (int): The number of top keyterms to extract.
+            text_doc (Doc, optional): An already parsed document to reuse.
         """
         self.raw_text = raw_text
-        self.text_doc = textacy.make_spacy_doc(self.raw_text, lang="en_core_web_md")
+        if text_doc is None:
+            text_doc = textacy.make_spacy_doc(
+                self.raw_text, lang=get_nlp("en_core_web_md")
+            )
+        self.text_doc = text_doc
         self.top_n_values = top_n_values
 
     def get_keyterms_based_on_textrank(self):
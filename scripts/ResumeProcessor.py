@@ -4,15 +4,25 @@ import pathlib
 
 from .parsers import ParseJobDesc, ParseResume
 from .ReadPdf import read_single_pdf
+from .utils.Utils import generate_document_id, hash_file
 
 READ_RESUME_FROM = "../data/Resumes/"
 SAVE_DIRECTORY = "../data/Processed/Resumes"
 
 
 class ResumeProcessor:
-    def __init__(self, input_file):
+    save_directory = SAVE_DIRECTORY
+
+    def __init__(self, input_file, unique_id=None):
         self.input_file = input_file
-        self.input_file_name = os.path.join(READ_RESUME_FROM + self.name)
+        self.input_file_name = os.path.join(READ_RESUME_FROM + self.input_file)
+        self.unique_id = unique_id
+        self.output_file = None
+
+    def document_id(self) -> str:
+        if self.unique_id is None:
+            self.unique_id = generate_document_id(hash_file(self.input_file_name))
+        return self.unique_id
 
     def process(self) -> bool:
         try:
@@ -25,7 +35,7 @@ class ResumeProcessor:
 
     def _read_resumes(self) -> dict:
         data = read_single_pdf(self.input_file_name)
-        output = ParseResume(data).get_JSON()
+        output = ParseResume(data, unique_id=self.document_id()).get_JSON()
         return output
 
     def _read_job_desc(self) -> dict:
@@ -38,6 +48,7 @@ class ResumeProcessor:
             "Resume-" + self.input_file + resume_dictionary["unique_id"] + ".json"
         )
         save_directory_name = pathlib.Path(SAVE_DIRECTORY) / file_name
+        self.output_file = file_name
         json_object = json.dumps(resume_dictionary, sort_keys=True, indent=14)
         with open(save_directory_name, "w+") as outfile:
             outfile.write(json_object)
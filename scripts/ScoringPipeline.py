@@ -0,0 +1,271 @@
+import io
+import logging
+import os
+
+from scripts.powerExtract import ResumeJobMatchingSystem, get_stop_words
+from scripts.similarity.cosine_scorer import get_cosine_score, get_cosine_scorer
+from scripts.similarity.embedding_scorer import DEFAULT_EMBEDDING_MODEL
+from scripts.taxonomy import get_skill_matcher, get_title_index
+from scripts.utils.ModelRegistry import get_model, get_model_stats, is_loaded
+from scripts.utils.ParseCache import cache_key
+from scripts.utils.Uploads import read_document
+from scripts.utils.Utils import hash_bytes
+
+logger = logging.getLogger(__name__)
+
+JOB_SKILLS_PATH = os.environ.get("JOB_SKILLS_PATH", "data/job_skills.json")
+JOB_SKILLS_CSV_PATH = "data/job_skills.csv"
+
+
+def get_matching_system(json_filepath: str = JOB_SKILLS_PATH) -> ResumeJobMatchingSystem:
+    """
+    Get the process-wide ResumeJobMatchingSystem for a taxonomy.
+
+    Args:
+        json_filepath (str): The taxonomy JSON file or snapshot directory.
+
+    Returns:
+        ResumeJobMatchingSystem: The shared matching system.
+    """
+    return get_model(
+        f"matching_system:{json_filepath}",
+        lambda: ResumeJobMatchingSystem(json_filepath, JOB_SKILLS_CSV_PATH),
+    )
+
+
+def _model_names(json_filepath: str) -> list:
+    return [
+        f"matching_system:{json_filepath}",
+        f"title_index:{json_filepath}",
+        f"skill_matcher:{json_filepath}",
+        f"cosine_scorer:{DEFAULT_EMBEDDING_MODEL}",
+    ]
+
+
+def preload(json_filepath: str = JOB_SKILLS_PATH) -> dict:
+    """
+    Load every model the scoring pipeline uses, so no request pays for it.
+
+    Calling this in a server's master process before it forks workers lets
+    the workers share the loaded pages copy-on-write.
+
+    Args:
+        json_filepath (str): The taxonomy JSON file or snapshot directory.
+
+    Returns:
+        dict: The load time and memory growth of every model, as returned by
+        `get_model_stats`.
+    """
+    get_stop_words()
+    matching_system = get_matching_system(json_filepath)
+    if matching_system.taxonomy is not None:
+        taxonomy = matching_system.taxonomy
+        # Hashed once here rather than by the first request
+        taxonomy.fingerprint
+        get_model(f"title_index:{json_filepath}", lambda: get_title_index(taxonomy))
+        get_model(f"skill_matcher:{json_filepath}", lambda: get_skill_matcher(taxonomy))
+    get_cosine_scorer()
+    stats = get_model_stats()
+    logger.info(f"Preloaded {len(stats)} models in {sum(s['load_seconds'] for s in stats.values()):.2f}s")
+    return stats
+
+
+def is_ready(json_filepath: str = JOB_SKILLS_PATH) -> bool:
+    """
+    Check whether `preload` has loaded every model in this process.
+
+    Args:
+        json_filepath (str): The taxonomy JSON file or snapshot directory.
+
+    Returns:
+        bool: True if every model is loaded.
+    """
+    return all(is_loaded(name) for name in _model_names(json_filepath))
+
+
+def _cached(parse_cache, key, compute):
+    if parse_cache is None:
+        return compute()
+    return parse_cache.get_or_compute(key, compute)
+
+
+def extract_advanced_keywords(matching_system, resume_text, job_description_text, job_title):
+    """
+    Extract the taxonomy skills found in a resume and a job description.
+
+    Args:
+        matching_system (ResumeJobMatchingSystem): The matching system.
+        resume_text (str): The text of the resume.
+        job_description_text (str): The text of the job description.
+        job_title (str): The job title the resume is scored for.
+
+    Returns:
+        list: The advanced keywords of the resume and of the job description.
+    """
+    job_title = job_title.lower()
+    resume_keywords = matching_system.extract_keywords(resume_text.lower())
+    job_keywords = matching_system.extract_keywords(job_description_text.lower())
+    matches = matching_system.find_job_title_matches(job_title)
+    resume_optimized_keywords = matching_system.optimize_keywords(matches, resume_keywords)
+    job_optimized_keywords = matching_system.optimize_keywords(matches, job_keywords)
+    resume_advanced_key_words = matching_system.process_keywords(resume_optimized_keywords, matches)
+    job_advanced_key_words = matching_system.process_keywords(job_optimized_keywords, matches)
+    return [resume_advanced_key_words, job_advanced_key_words]
+
+
+def _read_resume(resume_hash, read_resume_text, parse_cache):
+    # Scoring only needs the text, so the spaCy parse is skipped
+    return _cached(parse_cache, cache_key("resume_text", resume_hash), read_resume_text)
+
+
+def _similarity(resume_advanced_key_words, job_advanced_key_words):
+    resume_advanced_key_words = " ".join(resume_advanced_key_words)
+    job_advanced_key_words = " ".join(job_advanced_key_words)
+    return round(get_cosine_score(resume_advanced_key_words, job_advanced_key_words) * 100, 2)
+
+
+def prepare_job(job_description_text, job_title, parse_cache=None):
+    """
+    Do the job description side of scoring once, for scoring many resumes.
+
+    Args:
+        job_description_text (str): The text of the job description.
+        job_title (str): The job title the resumes are scored for.
+        parse_cache (ParseCache, optional): The cache of parse results.
+
+    Returns:
+        dict: The parsed job, to pass to `score_prepared`, or None if the job
+        skills taxonomy could not be loaded.
+    """
+    job_desc_hash = hash_bytes(job_description_text.encode("utf-8"))
+    matching_system = get_matching_system()
+    if matching_system.taxonomy is None:
+        return None
+    job_title = job_title.lower()
+    matches = matching_system.find_job_title_matches(job_title)
+    relevant_skills = matching_system.get_relevant_skills(matches)
+    job_keywords = matching_system.extract_keywords(job_description_text.lower())
+    job_optimized_keywords = matching_system.replace_keywords(job_keywords, relevant_skills)
+    return {
+        "taxonomy_fingerprint": matching_system.taxonomy.fingerprint,
+        "job_desc_hash": job_desc_hash,
+        "job_title": job_title,
+        "matches": matches,
+        "relevant_skills": relevant_skills,
+        "job_advanced_key_words": matching_system.process_keywords(job_optimized_keywords, matches),
+    }
+
+
+def score_prepared(job, resume_hash, read_resume_text, parse_cache=None):
+    """
+    Score a resume against a job description prepared by `prepare_job`.
+
+    Args:
+        job (dict): The job returned by `prepare_job`.
+        resume_hash (str): The content hash of the resume.
+        read_resume_text (callable): Returns the text of the resume. Only
+            called when the resume is not cached yet.
+        parse_cache (ParseCache, optional): The cache of parse results.
+
+    Returns:
+        float: The similarity score as a percentage.
+    """
+    resume_text = _read_resume(resume_hash, read_resume_text, parse_cache)
+    keywords_key = cache_key(
+        "keywords", resume_hash, job["job_desc_hash"], job["job_title"], job["taxonomy_fingerprint"]
+    )
+    keywords = parse_cache.get(keywords_key) if parse_cache is not None else None
+    if keywords is None:
+        matching_system = get_matching_system()
+        resume_keywords = matching_system.extract_keywords(resume_text.lower())
+        resume_optimized_keywords = matching_system.replace_keywords(resume_keywords, job["relevant_skills"])
+        keywords = [
+            matching_system.process_keywords(resume_optimized_keywords, job["matches"]),
+            job["job_advanced_key_words"],
+        ]
+        if parse_cache is not None:
+            parse_cache.set(keywords_key, keywords)
+    return _similarity(*keywords)
+
+
+def score_prepared_bytes(job, resume_hash, resume_bytes, file_type, parse_cache=None):
+    """
+    Score an uploaded resume against a job description prepared by
+    `prepare_job`, in a scoring process.
+
+    Args:
+        job (dict): The job returned by `prepare_job`.
+        resume_hash (str): The content hash of the resume.
+        resume_bytes (bytes): The uploaded resume.
+        file_type (str): The type of the resume, "pdf" or "docx".
+        parse_cache (ParseCache, optional): The cache of parse results.
+
+    Returns:
+        float: The similarity score as a percentage.
+    """
+    return score_prepared(
+        job,
+        resume_hash,
+        lambda: read_document(io.BytesIO(resume_bytes), file_type),
+        parse_cache=parse_cache,
+    )
+
+
+def score_resume(resume_hash, read_resume_text, job_description_text, job_title, parse_cache=None):
+    """
+    Score how well a resume matches a job description.
+
+    Args:
+        resume_hash (str): The content hash of the uploaded resume.
+        read_resume_text (callable): Returns the text of the resume. Only
+            called when the resume is not cached yet.
+        job_description_text (str): The text of the job description.
+        job_title (str): The job title the resume is scored for.
+        parse_cache (ParseCache, optional): The cache of parse results.
+
+    Returns:
+        float: The similarity score as a percentage, or None if the job
+        skills taxonomy could not be loaded.
+    """
+    resume_text = _read_resume(resume_hash, read_resume_text, parse_cache)
+    job_desc_hash = hash_bytes(job_description_text.encode("utf-8"))
+    matching_system = get_matching_system()
+    if matching_system.taxonomy is None:
+        return None
+
+    # Keywords depend on the taxonomy, so editing it invalidates them
+    keywords_key = cache_key(
+        "keywords", resume_hash, job_desc_hash, job_title.lower(), matching_system.taxonomy.fingerprint
+    )
+    keywords = parse_cache.get(keywords_key) if parse_cache is not None else None
+    if keywords is None:
+        keywords = extract_advanced_keywords(matching_system, resume_text, job_description_text, job_title)
+        if parse_cache is not None:
+            parse_cache.set(keywords_key, keywords)
+
+    return _similarity(*keywords)
+
+
+def score_resume_bytes(resume_bytes, job_description_text, job_title, parse_cache=None, file_type="pdf"):
+    """
+    Score an uploaded resume against a job description. Being a module-level
+    function of the scripts package, it can run in a scoring process.
+
+    Args:
+        resume_bytes (bytes): The uploaded resume.
+        job_description_text (str): The text of the job description.
+        job_title (str): The job title the resume is scored for.
+        parse_cache (ParseCache, optional): The cache of parse results.
+        file_type (str): The type of the resume, "pdf" or "docx".
+
+    Returns:
+        float: The similarity score as a percentage, or None if the job
+        skills taxonomy could not be loaded.
+    """
+    return score_resume(
+        hash_bytes(resume_bytes),
+        lambda: read_document(io.BytesIO(resume_bytes), file_type),
+        job_description_text,
+        job_title,
+        parse_cache=parse_cache,
+    )
@@ -1,3 +1,4 @@
 from . import ReadPdf
+from .BatchProcessor import BatchProcessor
 from .JobDescriptionProcessor import JobDescriptionProcessor
 from .ResumeProcessor import ResumeProcessor
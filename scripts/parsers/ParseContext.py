@@ -0,0 +1,78 @@
+from scripts.utils.ModelRegistry import get_nlp
+from scripts.utils.Utils import TextCleaner
+
+
+class ParseContext:
+    """
+    A class holding the cleaned text and a single spaCy Doc of a document,
+    shared by every extractor that parses it.
+    """
+
+    def __init__(self, raw_text: str, clean_text: str = None, doc=None):
+        """
+        Initialize the ParseContext object.
+
+        Args:
+            raw_text (str): The raw input text.
+            clean_text (str, optional): The already cleaned text.
+            doc (Doc, optional): The already parsed cleaned text.
+        """
+        self.raw_text = raw_text
+        if clean_text is None:
+            clean_text = TextCleaner.clean_text(self.raw_text)
+        self.clean_text = clean_text
+        if doc is None:
+            doc = get_nlp("en_core_web_md")(self.clean_text)
+        self.doc = doc
+
+    @classmethod
+    def pipe(cls, items, batch_size: int = 32, n_process: int = 1):
+        """
+        Stream many documents through nlp.pipe and yield their contexts.
+
+        Args:
+            items (Iterable[tuple]): Pairs of (raw text, context) where the
+                context is any object to carry along with the document.
+            batch_size (int): The number of texts buffered per nlp.pipe batch.
+            n_process (int): The number of processes used by nlp.pipe.
+
+        Yields:
+            tuple: Pairs of (ParseContext, context) in input order.
+        """
+        nlp = get_nlp("en_core_web_md")
+        stripped = (
+            (TextCleaner.remove_emails_links(raw_text), (raw_text, context))
+            for raw_text, context in items
+        )
+        # Punctuation is found from POS tags alone, so this pass runs only the
+        # tagging components, in this process. Only the full parse below
+        # starts `n_process` processes.
+        tagging = ("tok2vec", "tagger", "attribute_ruler")
+        cleaned = (
+            (TextCleaner.remove_punctuation(doc.text, doc), carried)
+            for doc, carried in nlp.pipe(
+                stripped,
+                as_tuples=True,
+                batch_size=batch_size,
+                disable=[name for name in nlp.pipe_names if name not in tagging],
+            )
+        )
+        for doc, (raw_text, context) in nlp.pipe(
+            cleaned, as_tuples=True, batch_size=batch_size, n_process=n_process
+        ):
+            yield cls(raw_text, doc.text, doc), context
+
+    def head(self, max_chars: int):
+        """
+        Return the leading part of the parsed document.
+
+        Args:
+            max_chars (int): The number of characters of cleaned text to keep.
+
+        Returns:
+            Span: The tokens fully contained in the first `max_chars` characters.
+        """
+        span = self.doc.char_span(0, min(max_chars, len(self.doc.text)), alignment_mode="contract")
+        if span is None:
+            return self.doc[0:0]
+        return span
@@ -4,28 +4,34 @@ import pathlib
 
 from scripts.Extractor import DataExtractor
 from scripts.KeytermsExtraction import KeytermExtractor
-from scripts.utils.Utils import CountFrequency, TextCleaner, generate_unique_id
+from scripts.parsers.ParseContext import ParseContext
+from scripts.utils.Utils import CountFrequency, generate_unique_id
 
 SAVE_DIRECTORY = "../data/Processed/JobDescription"
 
 class ParseJobDesc:
 
-    def __init__(self, job_desc: str):
+    def __init__(self, job_desc: str, context: ParseContext = None, unique_id: str = None):
+        if context is None:
+            context = ParseContext(job_desc)
+        self.unique_id = unique_id
         self.job_desc_data = job_desc
-        self.clean_data = TextCleaner.clean_text(self.job_desc_data)
-        self.entities = DataExtractor(self.clean_data).extract_entities()
-        self.key_words = DataExtractor(self.clean_data).extract_particular_words()
-        self.pos_frequencies = CountFrequency(self.clean_data).count_frequency()
-        self.keyterms = KeytermExtractor(self.clean_data).get_keyterms_based_on_sgrank()
-        self.bi_grams = KeytermExtractor(self.clean_data).bi_gramchunker()
-        self.tri_grams = KeytermExtractor(self.clean_data).tri_gramchunker()
+        self.clean_data = context.clean_text
+        extractor = DataExtractor(self.clean_data, doc=context.doc)
+        keyterm_extractor = KeytermExtractor(self.clean_data, text_doc=context.doc)
+        self.entities = extractor.extract_entities()
+        self.key_words = extractor.extract_particular_words()
+        self.pos_frequencies = CountFrequency(self.clean_data, doc=context.doc).count_frequency()
+        self.keyterms = keyterm_extractor.get_keyterms_based_on_sgrank()
+        self.bi_grams = keyterm_extractor.bi_gramchunker()
+        self.tri_grams = keyterm_extractor.tri_gramchunker()
 
     def get_JSON(self) -> dict:
         """
         Returns a dictionary of job description data.
         """
         job_desc_dictionary = {
-            "unique_id": generate_unique_id(),
+            "unique_id": self.unique_id or generate_unique_id(),
             "job_desc_data": self.job_desc_data,
             "clean_data": self.clean_data,
             "entities": self.entities,
@@ -5,34 +5,41 @@ import pathlib
 
 from scripts.Extractor import DataExtractor
 from scripts.KeytermsExtraction import KeytermExtractor
-from scripts.utils.Utils import CountFrequency, TextCleaner, generate_unique_id
+from scripts.parsers.ParseContext import ParseContext
+from scripts.utils.Utils import CountFrequency, generate_unique_id
 
 SAVE_DIRECTORY = "../data/Processed/Resumes"
 
 
 class ParseResume:
 
-    def __init__(self, resume: str):
+    def __init__(self, resume: str, context: ParseContext = None, unique_id: str = None):
+        if context is None:
+            context = ParseContext(resume)
+        self.unique_id = unique_id
         self.resume_data = resume
-        self.clean_data = TextCleaner.clean_text(self.resume_data)
-        self.entities = DataExtractor(self.clean_data).extract_entities()
-        self.name = DataExtractor(self.clean_data[:30]).extract_names()
-        self.experience = DataExtractor(self.clean_data).extract_experience()
-        self.emails = DataExtractor(self.resume_data).extract_emails()
-        self.phones = DataExtractor(self.resume_data).extract_phone_numbers()
-        self.years = DataExtractor(self.clean_data).extract_position_year()
-        self.key_words = DataExtractor(self.clean_data).extract_particular_words()
-        self.pos_frequencies = CountFrequency(self.clean_data).count_frequency()
-        self.keyterms = KeytermExtractor(self.clean_data).get_keyterms_based_on_sgrank()
-        self.bi_grams = KeytermExtractor(self.clean_data).bi_gramchunker()
-        self.tri_grams = KeytermExtractor(self.clean_data).tri_gramchunker()
+        self.clean_data = context.clean_text
+        clean_extractor = DataExtractor(self.clean_data, doc=context.doc)
+        raw_extractor = DataExtractor(self.resume_data, doc=context.doc)
+        keyterm_extractor = KeytermExtractor(self.clean_data, text_doc=context.doc)
+        self.entities = clean_extractor.extract_entities()
+        self.name = DataExtractor(self.clean_data[:30], doc=context.head(30)).extract_names()
+        self.experience = clean_extractor.extract_experience()
+        self.emails = raw_extractor.extract_emails()
+        self.phones = raw_extractor.extract_phone_numbers()
+        self.years = clean_extractor.extract_position_year()
+        self.key_words = clean_extractor.extract_particular_words()
+        self.pos_frequencies = CountFrequency(self.clean_data, doc=context.doc).count_frequency()
+        self.keyterms = keyterm_extractor.get_keyterms_based_on_sgrank()
+        self.bi_grams = keyterm_extractor.bi_gramchunker()
+        self.tri_grams = keyterm_extractor.tri_gramchunker()
 
     def get_JSON(self) -> dict:
         """
         Returns a dictionary of resume data.
         """
         resume_dictionary = {
-            "unique_id": generate_unique_id(),
+            "unique_id": self.unique_id or generate_unique_id(),
             "resume_data": self.resume_data,
             "clean_data": self.clean_data,
             "entities": self.entities,
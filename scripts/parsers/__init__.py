@@ -1,2 +1,3 @@
+from .ParseContext import ParseContext
 from .ParseJobDescToJson import ParseJobDesc
 from .ParseResumeToJson import ParseResume
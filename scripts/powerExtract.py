@@ -2,27 +2,146 @@ import json
 import nltk
 import pandas as pd
 import numpy as np
-import spacy
-from nltk.util import ngrams
 from nltk.corpus import stopwords
 from nltk.tokenize import word_tokenize
-from fuzzywuzzy import process, fuzz
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from fuzzywuzzy import utils
+from rapidfuzz import process as rf_process
+from rapidfuzz.distance import Indel
+
+from scripts.taxonomy import get_skill_matcher, get_soft_skill_index, get_title_index, load_taxonomy
 
 # Ensure necessary resources are downloaded
-nlp = spacy.load('en_core_web_md')
 nltk.download('punkt')
 nltk.download('stopwords')
 
+# English stopwords, loaded once on first use by get_stop_words
+STOP_WORDS = None
+
+
+def get_stop_words():
+    """Get the English stopword set, shared by every call."""
+    global STOP_WORDS
+    if STOP_WORDS is None:
+        STOP_WORDS = frozenset(stopwords.words('english'))
+    return STOP_WORDS
+
+
+def iter_keywords(text, max_ngrams=None):
+    """
+    Lazily yield the keywords of a text: its words without stopwords and
+    punctuation, then their bigrams, then their trigrams.
+
+    Args:
+        text (str): The text to extract keywords from.
+        max_ngrams (int, optional): The maximum number of bigrams and
+            trigrams to yield. Defaults to no limit.
+
+    Yields:
+        str: The keywords, in the order `extract_keywords` returns them.
+    """
+    stop_words = get_stop_words()
+    words = [word for word in word_tokenize(text.lower()) if word not in stop_words and word.isalnum()]
+    yield from words
+
+    # The words are already stopword-free, so every n-gram is a keyword.
+    remaining = max_ngrams
+    for n in (2, 3):
+        for gram in zip(*(words[i:] for i in range(n))):
+            if remaining is not None:
+                if remaining <= 0:
+                    return
+                remaining -= 1
+            yield ' '.join(gram)
+
+
+# Keywords scored against every skill per chunk, bounding the score matrix size
+FUZZY_CHUNK_SIZE = 4096
+
+
+def _token_sort_form(text):
+    """Process and sort tokens exactly as fuzz.token_sort_ratio does."""
+    return " ".join(sorted(utils.full_process(text, force_ascii=True).split()))
+
+
+def best_skill_matches(keywords, skills, threshold=95):
+    """
+    Find the best matching skill of every keyword using a vectorized
+    keyword-by-skill score matrix.
+
+    Scores are the integer `fuzz.token_sort_ratio` values, computed from
+    Indel distances with the same arithmetic and rounding, and ties go to the
+    first skill in `skills` as with `process.extract`.
+
+    Args:
+        keywords (list): The keywords to match.
+        skills (list): The candidate skills.
+        threshold (int): A match must score strictly above this value.
+
+    Returns:
+        list: The best matching skill of each keyword, or None below the threshold.
+    """
+    if not keywords or not skills:
+        return [None] * len(keywords)
+
+    # Score each distinct processed skill once, remembering its first position.
+    skill_forms = {}
+    for skill in skills:
+        skill_forms.setdefault(_token_sort_form(skill), skill)
+    forms = list(skill_forms)
+    best_skills = list(skill_forms.values())
+    skill_lengths = np.array([len(form) for form in forms], dtype=np.int64)
+
+    keyword_forms = [_token_sort_form(keyword) for keyword in keywords]
+    matches = []
+    for start in range(0, len(keyword_forms), FUZZY_CHUNK_SIZE):
+        chunk = keyword_forms[start:start + FUZZY_CHUNK_SIZE]
+        distances = rf_process.cdist(chunk, forms, scorer=Indel.distance, dtype=np.int64, workers=-1)
+        keyword_lengths = np.array([len(form) for form in chunk], dtype=np.int64)
+        lensum = keyword_lengths[:, None] + skill_lengths[None, :]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = np.where(lensum > 0, (lensum - distances) / lensum, 1.0)
+        scores = np.round(100 * ratios).astype(np.int64)
+        best = scores.argmax(axis=1)
+        best_scores = scores[np.arange(len(chunk)), best]
+        matches.extend(
+            best_skills[j] if score > threshold else None
+            for j, score in zip(best, best_scores)
+        )
+    return matches
+
 class ResumeJobMatchingSystem:
-    def __init__(self, json_filepath, csv_filepath, soft_skills_filepath):
+    def __init__(self, json_filepath, csv_filepath=None, soft_skills_filepath=None):
         self.json_filepath = json_filepath
         self.csv_filepath = csv_filepath
         self.soft_skills_filepath = soft_skills_filepath
-        self.df = self.convert_json_to_csv()
+        self.taxonomy = self.load_taxonomy()
+        self._df = None
         self.soft_skills_df = self.load_soft_skills()
 
+    @property
+    def df(self):
+        """
+        The taxonomy as a DataFrame, built on first access for callers that
+        still expect one. Lookups use `self.taxonomy` instead.
+        """
+        if self._df is None and self.taxonomy is not None:
+            self._df = pd.DataFrame(self.taxonomy.to_records())
+        return self._df
+
+    def load_taxonomy(self):
+        """
+        Load the compiled job skills taxonomy, shared by every instance built
+        from the same file.
+        """
+        try:
+            return load_taxonomy(self.json_filepath)
+        except FileNotFoundError:
+            print(f"Error: The file {self.json_filepath} does not exist.")
+            return None
+        except Exception as e:
+            print(f"An error occurred: {e}")
+            return None
+
     def convert_json_to_csv(self):
         try:
             with open(self.json_filepath, 'r') as file:
@@ -43,7 +162,18 @@ class ResumeJobMatchingSystem:
             print(f"An error occurred: {e}")
             return None
 
+    @property
+    def soft_skill_index(self):
+        """
+        The compiled index over the soft skills, shared by every instance
+        loading the same skills.
+        """
+        all_soft_skills = [skill for skills in self.soft_skills_df['skills'].tolist() for skill in skills]
+        return get_soft_skill_index(all_soft_skills)
+
     def load_soft_skills(self):
+        if self.soft_skills_filepath is None:
+            return None
         try:
             with open(self.soft_skills_filepath, 'r') as file:
                 soft_skills_data = json.load(file)
@@ -57,9 +187,7 @@ class ResumeJobMatchingSystem:
             return None
 
     def find_job_title_matches(self, job_title, limit=3):
-        self.df['id'] = self.df['id'].astype(str)
-        results = process.extract(job_title, self.df['id'], limit=limit)
-        return results
+        return get_title_index(self.taxonomy).search(job_title, limit=limit)
 
     def optimize_keywords(self, job_titles, user_keywords):
         relevant_skills = self.get_relevant_skills(job_titles)
@@ -69,51 +197,42 @@ class ResumeJobMatchingSystem:
     def get_relevant_skills(self, job_titles):
         relevant_skills = []
         for title, _, _ in job_titles:
-            skills = self.df.loc[self.df['id'] == title, 'skills'].values[0]
-            relevant_skills.extend(skills)
+            relevant_skills.extend(self.taxonomy.skills_for_title(title))
         return relevant_skills
 
     def replace_keywords(self, user_keywords, relevant_skills):
-        optimized_keywords = user_keywords.copy()
-        for keyword in user_keywords:
-            matches = process.extract(keyword, relevant_skills, scorer=fuzz.token_sort_ratio)
-            best_match, best_score = max(matches, key=lambda x: x[1])
-            if best_score > 95:  # Threshold for replacement
-                if keyword in optimized_keywords:
-                    optimized_keywords.remove(keyword)
-                optimized_keywords.append(best_match)
-        return optimized_keywords
+        # Score each distinct keyword once; replaced keywords move to the end
+        # as their best matching skill, the rest keep their order.
+        unique_keywords = list(dict.fromkeys(user_keywords))
+        replacements = dict(zip(unique_keywords, best_skill_matches(unique_keywords, relevant_skills)))
+        kept = [keyword for keyword in user_keywords if replacements[keyword] is None]
+        replaced = [replacements[keyword] for keyword in user_keywords if replacements[keyword] is not None]
+        return kept + replaced
 
     def process_keywords(self, optimized_key_words, job_titles):
         actual_key_words = self.get_actual_key_words(job_titles)
-        vectors = np.concatenate([np.array([text for text in optimized_key_words]),
-                                np.array([text for text in actual_key_words.keys()])])
-
-        tfidf = TfidfVectorizer()
-        tfidf_matrix = tfidf.fit_transform(vectors).toarray()
-
-        opt_vectors = tfidf_matrix[:len(optimized_key_words)]
-        act_vectors = tfidf_matrix[len(optimized_key_words):]
-
-        opt_norms = np.linalg.norm(opt_vectors, axis=1, keepdims=True) + 1e-10
-        act_norms = np.linalg.norm(act_vectors, axis=1, keepdims=True) + 1e-10
-        similarity_scores = np.dot(opt_vectors, act_vectors.T) / (opt_norms * act_norms.T)
-        advanced_key_words = {}
-        for i, score_row in enumerate(similarity_scores):
-            for j, similarity_score in enumerate(score_row):
-                if similarity_score >= 0.90:
-                    act_keyword = list(actual_key_words)[j]
-                    advanced_key_words[act_keyword] = actual_key_words[act_keyword]
-        return advanced_key_words
+        # The same skill IDs as the keys of actual_key_words, in the same order
+        skill_ids = list(dict.fromkeys(
+            skill_id for title, _, _ in job_titles for skill_id in self.taxonomy.skill_ids_for_title(title)
+        ))
+        matched = get_skill_matcher(self.taxonomy).match(optimized_key_words, skill_ids, threshold=0.90)
+        skills = self.taxonomy.skills
+        return {skills[skill_id]: actual_key_words[skills[skill_id]] for skill_id in matched}
 
     def get_actual_key_words(self, job_titles):
         actual_key_words = {}
         for title, _, _ in job_titles:
-            skills = self.df.loc[self.df['id'] == title, 'skills'].values[0]
-            for skill in skills:
+            for skill in self.taxonomy.skills_for_title(title):
                 actual_key_words[skill] = actual_key_words.get(skill, 0) + 1
         return actual_key_words
     
+    def find_best_fit_titles(self, keywords, limit=5):
+        # Without the titles' skills as candidates, fuzzy matching finds
+        # longer skills such as "Docker Security" for "docker", so only skills
+        # named by a keyword count
+        skill_ids = self.taxonomy.skill_ids_for_keywords(keywords)
+        return self.taxonomy.best_fit_titles(skill_ids, limit=limit)
+
     def get_actual_soft_skills(self, text):
         pass # returns the actual soft skills found in the text
 
@@ -121,65 +240,19 @@ class ResumeJobMatchingSystem:
         pass # algorithm to score and select the most relevant soft skills from the actual and all soft skills
     
     def extract_soft_skills(self, text):
-        soft_skills = []
-        for _, row in self.soft_skills_df.iterrows():
-            skill_keywords = row['skills']
-            for keyword in skill_keywords:
-                if keyword.lower() in text.lower():
-                    soft_skills.append(row['skills'])
-        return list(soft_skills)
+        # One pass of a compiled, case-insensitive matcher over the text
+        return self.soft_skill_index.find(text)
 
     @staticmethod
     def extract_keywords(text):
-        stop_words = set(stopwords.words('english'))
-        words = word_tokenize(text.lower())
-        filtered_words = [word for word in words if word not in stop_words and word.isalnum()]
-
-        # Generate n-grams
-        bigrams = [' '.join(gram) for gram in ngrams(filtered_words, 2) if not any(stop in gram for stop in stop_words)]
-        trigrams = [' '.join(gram) for gram in ngrams(filtered_words, 3) if not any(stop in gram for stop in stop_words)]
-
-        # Combine single words and n-grams
-        full_keywords = filtered_words + bigrams + trigrams
-        return full_keywords
+        return list(iter_keywords(text))
     
     def process_soft_keywords(self, list_of_strings):
-        # Create a set of all unique soft skills
-        all_soft_skills = set(skill for skills in self.soft_skills_df['skills'].tolist() for skill in skills)
-        soft_skills_text = ' '.join(all_soft_skills)  # Create one large text of all soft skills
-        soft_skills_doc = nlp(soft_skills_text)  # This is now a spaCy doc containing all soft skills
-
-        # Combine list elements into a single string and create a spaCy document
-        combined_text = ' '.join(list_of_strings)
-        text_doc = nlp(combined_text)
-
-        # Prepare soft skill vectors and text vectors
-        skill_vectors = np.array([skill.vector for skill in soft_skills_doc if skill.has_vector])
-        skill_words = [skill.text for skill in soft_skills_doc if skill.has_vector]
-
-        text_vectors = np.array([token.vector for token in text_doc if not token.is_stop and not token.is_punct and token.has_vector])
-
-        if text_vectors.size == 0 or skill_vectors.size == 0:
-            return {}
-        # Calculate cosine similarities between all tokens and all skills
-        similarity_matrix = np.dot(text_vectors, skill_vectors.T)
-        text_norms = np.linalg.norm(text_vectors, axis=1, keepdims=True)
-        skill_norms = np.linalg.norm(skill_vectors, axis=1, keepdims=True)
-        similarity_scores = similarity_matrix / (text_norms * skill_norms.T + 1e-10)
-        # Identify highly similar skills
-        advanced_soft_key_words = {}
-        high_similarity_indices = np.where(similarity_scores > 0.90)
-        for text_idx, skill_idx in zip(*high_similarity_indices):
-            skill_word = skill_words[skill_idx]
-            if skill_word in advanced_soft_key_words:
-                advanced_soft_key_words[skill_word] += 1
-            else:
-                advanced_soft_key_words[skill_word] = 1
-
-        return advanced_soft_key_words
+        # Soft-skill vectors and per-token matches are computed once per process
+        return self.soft_skill_index.count_matches(list_of_strings)
     
 def analyze_job_fit_hard_skills(matching_system, job_title, resume_text, job_text):
-    if matching_system.df is not None:
+    if matching_system.taxonomy is not None:
         resume_keywords = matching_system.extract_keywords(resume_text)
         job_keywords = matching_system.extract_keywords(job_text)
         matches = matching_system.find_job_title_matches(job_title)
@@ -195,11 +268,20 @@ def analyze_job_fit_hard_skills(matching_system, job_title, resume_text, job_tex
         print("No data frame found in the matching system.")
 
 def analyze_job_fit_soft_skills(matching_system, resume_text, job_text):
-    if matching_system.df is not None and matching_system.soft_skills_df is not None:
+    if matching_system.taxonomy is not None and matching_system.soft_skills_df is not None:
         resume_soft_skills = matching_system.extract_keywords(resume_text) 
         job_soft_skills = matching_system.extract_keywords(job_text)
         soft_resume_advanced_key_words = matching_system.process_soft_keywords(resume_soft_skills)
         soft_job_advanced_key_words = matching_system.process_soft_keywords(job_soft_skills)
         return soft_resume_advanced_key_words, soft_job_advanced_key_words
     else:
-        print("No data frame found in the matching system.")
\ No newline at end of file
+        print("No data frame found in the matching system.")
+
+def analyze_best_fit_titles(matching_system, resume_text, limit=5):
+    if matching_system.taxonomy is not None:
+        resume_keywords = matching_system.extract_keywords(resume_text)
+        best_fit_titles = matching_system.find_best_fit_titles(resume_keywords, limit=limit)
+        print("Best fit job titles:", best_fit_titles)
+        return best_fit_titles
+    else:
+        print("No data frame found in the matching system.")
@@ -0,0 +1,191 @@
+import logging
+
+import numpy as np
+
+from scripts.similarity.embedding_cache import DEFAULT_MAX_BYTES, EmbeddingCache
+from scripts.similarity.embedding_scorer import DEFAULT_EMBEDDING_MODEL
+from scripts.utils.ModelRegistry import get_model
+
+logger = logging.getLogger(__name__)
+
+
+def get_text_embedding(model_name=DEFAULT_EMBEDDING_MODEL):
+    """
+    Get the process-wide fastembed model, loading it on first use.
+
+    Args:
+        model_name (str): The fastembed model name.
+
+    Returns:
+        TextEmbedding: The shared embedding model.
+    """
+
+    def load():
+        from fastembed import TextEmbedding
+
+        return TextEmbedding(model_name=model_name)
+
+    return get_model(f"fastembed:{model_name}", load)
+
+
+class CosineScorer:
+    """
+    A scorer for 1:1 comparisons that embeds both texts in one model call and
+    computes their cosine similarity in NumPy, without a vector database.
+    Embeddings are memoized in an LRU EmbeddingCache.
+    """
+
+    def __init__(self, model_name=DEFAULT_EMBEDDING_MODEL, cache_max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the CosineScorer object.
+
+        Args:
+            model_name (str): The fastembed model used to embed texts.
+            cache_max_bytes (int): The memory cap of the embedding cache.
+        """
+        self.model_name = model_name
+        self.model = get_text_embedding(model_name)
+        self.cache = EmbeddingCache(self._embed_uncached, max_bytes=cache_max_bytes)
+
+    def _embed_uncached(self, texts) -> np.ndarray:
+        return np.stack(list(self.model.embed(texts, batch_size=max(len(texts), 1))))
+
+    def embed(self, texts) -> np.ndarray:
+        """
+        Embed texts, sending every cache miss to the model in a single batched call.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            np.ndarray: One embedding per row.
+        """
+        return self.cache.embed(list(texts))
+
+    def score(self, resume_string, job_description_string) -> float:
+        """
+        Score a resume against a job description.
+
+        The value matches the `score` of the first hit returned by `get_score`,
+        which Qdrant computes as the cosine similarity of the same embeddings.
+
+        Args:
+            resume_string (str): The text of the resume.
+            job_description_string (str): The text of the job description.
+
+        Returns:
+            float: The cosine similarity between the two texts.
+        """
+        resume_vector, job_vector = self.embed([resume_string, job_description_string])
+        norms = np.linalg.norm(resume_vector) * np.linalg.norm(job_vector)
+        if norms == 0:
+            return 0.0
+        return float(np.dot(resume_vector, job_vector) / norms)
+
+    def score_many(self, resumes, job_description_string, batch_size: int = 32) -> np.ndarray:
+        """
+        Score many resumes against one job description.
+
+        Args:
+            resumes (list): The texts of the resumes.
+            job_description_string (str): The text of the job description.
+            batch_size (int): The number of resumes embedded per model call.
+
+        Returns:
+            np.ndarray: The cosine similarity of each resume, in input order.
+        """
+        resumes = list(resumes)
+        scores = np.zeros(len(resumes), dtype=np.float32)
+        if not resumes:
+            return scores
+        job_vector = self.embed([job_description_string])[0]
+        job_norm = np.linalg.norm(job_vector)
+        if job_norm == 0:
+            return scores
+        job_vector = job_vector / job_norm
+        batch_size = max(1, batch_size)
+        for start in range(0, len(resumes), batch_size):
+            resume_vectors = self.embed(resumes[start : start + batch_size])
+            norms = np.linalg.norm(resume_vectors, axis=1)
+            norms[norms == 0] = 1.0
+            scores[start : start + len(resume_vectors)] = resume_vectors @ job_vector / norms
+        return scores
+
+    def rank(self, resumes, job_description_string, batch_size: int = 32, limit: int = None) -> list:
+        """
+        Rank resumes by their similarity to one job description.
+
+        Args:
+            resumes (list): The texts of the resumes.
+            job_description_string (str): The text of the job description.
+            batch_size (int): The number of resumes embedded per model call.
+            limit (int, optional): The number of top results to return.
+
+        Returns:
+            list: Dictionaries with the `index`, a `text` preview and the
+            `score` of each resume, best first.
+        """
+        resumes = list(resumes)
+        scores = self.score_many(resumes, job_description_string, batch_size=batch_size)
+        order = np.argsort(-scores, kind="stable")
+        if limit is not None:
+            order = order[:limit]
+        return [
+            {"index": int(i), "text": resumes[i][:30], "score": float(scores[i])}
+            for i in order
+        ]
+
+
+def get_cosine_scorer(model_name=DEFAULT_EMBEDDING_MODEL) -> CosineScorer:
+    """
+    Get the process-wide CosineScorer for a model, creating it on first use.
+
+    Args:
+        model_name (str): The fastembed model used to embed texts.
+
+    Returns:
+        CosineScorer: The shared scorer.
+    """
+    return get_model(f"cosine_scorer:{model_name}", lambda: CosineScorer(model_name))
+
+
+def get_cosine_score(resume_string, job_description_string) -> float:
+    """
+    Calculate the similarity score between a resume and a job description.
+
+    Args:
+        resume_string (str): The text of the resume.
+        job_description_string (str): The text of the job description.
+
+    Returns:
+        float: The cosine similarity, comparable to `get_score(...)[0].score`.
+    """
+    logger.info("Started getting similarity score")
+    score = get_cosine_scorer().score(resume_string, job_description_string)
+    logger.info("Finished getting similarity score")
+    return score
+
+
+def rank_resumes(resumes, job_description_string, batch_size: int = 32, limit: int = None) -> list:
+    """
+    Rank many resumes against one job description.
+
+    Takes the same inputs as `QdrantSearch(resumes, jd)` but embeds the resumes
+    in batches and scores them in memory.
+
+    Args:
+        resumes (list): The texts of the resumes.
+        job_description_string (str): The text of the job description.
+        batch_size (int): The number of resumes embedded per model call.
+        limit (int, optional): The number of top results to return.
+
+    Returns:
+        list: Dictionaries with the `index`, a `text` preview and the `score`
+        of each resume, best first.
+    """
+    logger.info(f"Started ranking {len(resumes)} resumes")
+    ranking = get_cosine_scorer().rank(
+        resumes, job_description_string, batch_size=batch_size, limit=limit
+    )
+    logger.info("Finished ranking resumes")
+    return ranking
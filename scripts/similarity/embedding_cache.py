@@ -0,0 +1,137 @@
+import hashlib
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MAX_BYTES = int(os.environ.get("EMBEDDING_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text before embedding so trivially different inputs share an entry.
+
+    Args:
+        text (str): The input text.
+
+    Returns:
+        str: The NFC-normalized text with runs of whitespace collapsed.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class EmbeddingCache:
+    """
+    A memoizing layer in front of an embedding model, keyed by a hash of the
+    normalized input text, with a memory cap, LRU eviction and hit/miss
+    counters.
+    """
+
+    def __init__(self, embed_function, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the EmbeddingCache object.
+
+        Args:
+            embed_function (callable): Embeds a list of texts and returns one
+                vector per text.
+            max_bytes (int): The total size of cached vectors above which the
+                least recently used entries are evicted.
+        """
+        self.embed_function = embed_function
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(normalized: str) -> str:
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def embed(self, texts) -> np.ndarray:
+        """
+        Embed texts, calling the model once for all the cache misses.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            np.ndarray: One embedding per row, in input order.
+        """
+        if len(texts) == 0:
+            return np.empty((0, 0), dtype=np.float32)
+        normalized = [normalize_text(text) for text in texts]
+        keys = [self._key(text) for text in normalized]
+        vectors = [None] * len(keys)
+        missing = {}
+        with self._lock:
+            for i, key in enumerate(keys):
+                vector = self._entries.get(key)
+                if vector is None:
+                    missing.setdefault(key, []).append(i)
+                    self.misses += 1
+                else:
+                    self._entries.move_to_end(key)
+                    vectors[i] = vector
+                    self.hits += 1
+
+        if missing:
+            missing_keys = list(missing)
+            missing_texts = [normalized[missing[key][0]] for key in missing_keys]
+            embedded = np.asarray(self.embed_function(missing_texts))
+            with self._lock:
+                for key, vector in zip(missing_keys, embedded):
+                    vector = np.array(vector, copy=True)
+                    vector.setflags(write=False)
+                    for i in missing[key]:
+                        vectors[i] = vector
+                    self._store(key, vector)
+
+        return np.stack(vectors)
+
+    def _store(self, key, vector):
+        if vector.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = vector
+        self._bytes += vector.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: The hits, misses, evictions, hit rate, entry count and bytes used.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        """
+        Drop every cached vector and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
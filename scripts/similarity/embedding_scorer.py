@@ -0,0 +1,84 @@
+import logging
+import threading
+
+from qdrant_client import QdrantClient
+
+from scripts.utils.ModelRegistry import get_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EMBEDDING_MODEL = "BAAI/bge-base-en"
+
+
+class EmbeddingScorer:
+    """
+    A long-lived scorer that loads the embedding model once and keeps an
+    in-memory Qdrant client warm between calls.
+    """
+
+    def __init__(self, model_name=DEFAULT_EMBEDDING_MODEL, collection_name="demo_collection"):
+        """
+        Initialize the EmbeddingScorer object.
+
+        Args:
+            model_name (str): The fastembed model used to embed documents.
+            collection_name (str): The name of the scratch collection.
+        """
+        self.model_name = model_name
+        self.collection_name = collection_name
+        self.client = QdrantClient(":memory:")
+        self.client.set_model(model_name)
+        # The scratch collection holds a single point, so calls must not interleave.
+        self._lock = threading.Lock()
+
+    def score_pair(self, resume_string, job_description_string):
+        """
+        Score a resume against a job description.
+
+        Args:
+            resume_string (str): The text of the resume.
+            job_description_string (str): The text of the job description.
+
+        Returns:
+            list: The search result, in the same shape as `get_score`.
+        """
+        with self._lock:
+            # Reusing the same point ID overwrites the previous resume in place.
+            self.client.add(
+                collection_name=self.collection_name,
+                documents=[resume_string],
+                ids=[0],
+            )
+            return self.client.query(
+                collection_name=self.collection_name,
+                query_text=job_description_string,
+                limit=1,
+            )
+
+    def score(self, resume_string, job_description_string) -> float:
+        """
+        Score a resume against a job description.
+
+        Args:
+            resume_string (str): The text of the resume.
+            job_description_string (str): The text of the job description.
+
+        Returns:
+            float: The cosine similarity between the two texts.
+        """
+        return self.score_pair(resume_string, job_description_string)[0].score
+
+
+def get_embedding_scorer(model_name=DEFAULT_EMBEDDING_MODEL) -> EmbeddingScorer:
+    """
+    Get the process-wide EmbeddingScorer for a model, creating it on first use.
+
+    Args:
+        model_name (str): The fastembed model used to embed documents.
+
+    Returns:
+        EmbeddingScorer: The shared scorer.
+    """
+    return get_model(
+        f"embedding_scorer:{model_name}", lambda: EmbeddingScorer(model_name)
+    )
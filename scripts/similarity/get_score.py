@@ -1,11 +1,10 @@
 import json
 import logging
 import os
-from typing import List
 
 import yaml
-from qdrant_client import QdrantClient
 
+from scripts.similarity.embedding_scorer import get_embedding_scorer
 from scripts.utils.logger import init_logging_config
 
 init_logging_config(basic_log_level=logging.INFO)
@@ -106,8 +105,8 @@ def read_doc(path):
 
 def get_score(resume_string, job_description_string):
     """
-    The function `get_score` uses QdrantClient to calculate the similarity score between a resume and a
-    job description.
+    The function `get_score` uses the shared, warm EmbeddingScorer to calculate the similarity score
+    between a resume and a job description.
 
     Args:
       resume_string: The `resume_string` parameter is a string containing the text of a resume. It
@@ -123,18 +122,7 @@ def get_score(resume_string, job_description_string):
     """
     logger.info("Started getting similarity score")
 
-    documents: List[str] = [resume_string]
-    client = QdrantClient(":memory:")
-    client.set_model("BAAI/bge-base-en")
-
-    client.add(
-        collection_name="demo_collection",
-        documents=documents,
-    )
-
-    search_result = client.query(
-        collection_name="demo_collection", query_text=job_description_string
-    )
+    search_result = get_embedding_scorer().score_pair(resume_string, job_description_string)
     logger.info("Finished getting similarity score")
     return search_result
 
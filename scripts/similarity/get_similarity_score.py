@@ -1,6 +1,9 @@
 import json
 import logging
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import cohere
 import yaml
@@ -103,9 +106,88 @@ def read_doc(path):
     return data
 
 
+class CohereEmbeddingProvider:
+    """
+    An embedding provider backed by the Cohere embed API.
+    """
+
+    def __init__(self, client, model="large", dimension=4096):
+        """
+        Initialize the CohereEmbeddingProvider object.
+
+        Args:
+            client (cohere.Client): The Cohere client.
+            model (str): The Cohere embedding model.
+            dimension (int): The size of the vectors returned by the model.
+        """
+        self.client = client
+        self.model = model
+        self.dimension = dimension
+
+    def embed(self, texts):
+        """
+        Embed a batch of texts in one request.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: One list of floats per text.
+        """
+        embeddings = self.client.embed(texts, self.model).embeddings
+        return [list(map(float, embedding)) for embedding in embeddings]
+
+
+class LocalEmbeddingProvider:
+    """
+    An embedding provider running a local fastembed model, usable as a
+    stand-in for Cohere, e.g. in tests or offline runs.
+    """
+
+    def __init__(self, model_name=None):
+        """
+        Initialize the LocalEmbeddingProvider object.
+
+        Args:
+            model_name (str, optional): The fastembed model. Defaults to the
+                model used by the cosine scorer.
+        """
+        from scripts.similarity.cosine_scorer import get_cosine_scorer
+
+        self.scorer = get_cosine_scorer(model_name) if model_name else get_cosine_scorer()
+        self._dimension = None
+
+    @property
+    def dimension(self):
+        if self._dimension is None:
+            self._dimension = len(self.embed(["dimension probe"])[0])
+        return self._dimension
+
+    def embed(self, texts):
+        """
+        Embed a batch of texts in one model call.
+
+        Args:
+            texts (list): The texts to embed.
+
+        Returns:
+            list: One list of floats per text.
+        """
+        return self.scorer.embed(texts).tolist()
+
+
 # This class likely performs searches based on quadrants.
 class QdrantSearch:
-    def __init__(self, resumes, jd):
+    def __init__(
+        self,
+        resumes,
+        jd,
+        embedding_provider=None,
+        batch_size=96,
+        max_workers=4,
+        max_retries=3,
+        backoff_seconds=1.0,
+    ):
         """
         The function initializes various parameters and clients for processing resumes and job
         descriptions.
@@ -118,21 +200,35 @@ class QdrantSearch:
           jd: The `jd` parameter in the `__init__` method seems to represent a job description. It is
         likely used as input to compare against the resumes provided in the `resumes` parameter. The job
         description is probably used for matching and analyzing against the resumes in the system.
+          embedding_provider: An object with an `embed(texts)` method returning one vector per text
+        and a `dimension` attribute. Defaults to a `CohereEmbeddingProvider`; pass a
+        `LocalEmbeddingProvider` to run without Cohere.
+          batch_size: The number of texts sent per embedding request.
+          max_workers: The maximum number of embedding requests in flight at once.
+          max_retries: How many times a failed embedding request is retried.
+          backoff_seconds: The base delay of the exponential backoff between retries.
         """
         config = read_config(config_path + "/config.yml")
-        self.cohere_key = config["cohere"]["api_key"]
         self.qdrant_key = config["qdrant"]["api_key"]
         self.qdrant_url = config["qdrant"]["url"]
         self.resumes = resumes
         self.jd = jd
-        self.cohere = cohere.Client(self.cohere_key)
+        if embedding_provider is None:
+            self.cohere_key = config["cohere"]["api_key"]
+            self.cohere = cohere.Client(self.cohere_key)
+            embedding_provider = CohereEmbeddingProvider(self.cohere)
+        self.embedding_provider = embedding_provider
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max_retries
+        self.backoff_seconds = backoff_seconds
         self.collection_name = "resume_collection_name"
         self.qdrant = QdrantClient(
             url=self.qdrant_url,
             api_key=self.qdrant_key,
         )
 
-        vector_size = 4096
+        vector_size = self.embedding_provider.dimension
         print(f"collection name={self.collection_name}")
         self.qdrant.recreate_collection(
             collection_name=self.collection_name,
@@ -162,36 +258,63 @@ class QdrantSearch:
         2. The length of the embeddings list.
         """
         try:
-            embeddings = self.cohere.embed([text], "large").embeddings
-            return list(map(float, embeddings[0])), len(embeddings[0])
+            embeddings = self.embed_batch([text])
+            return embeddings[0], len(embeddings[0])
         except Exception as e:
             self.logger.error(f"Error getting embeddings: {e}", exc_info=True)
 
+    def embed_batch(self, texts):
+        """
+        Embed a batch of texts in one request, retrying with exponential backoff.
+
+        Args:
+          texts: The texts to embed.
+
+        Returns:
+          A list with one list of floats per text.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self.embedding_provider.embed(texts)
+            except Exception as e:
+                if attempt == self.max_retries:
+                    raise
+                delay = self.backoff_seconds * (2**attempt) * (1 + random.random())
+                self.logger.warning(
+                    f"Embedding request failed ({e}), retrying in {delay:.1f}s"
+                )
+                time.sleep(delay)
+
     def update_qdrant(self):
         """
         This Python function updates vectors and corresponding metadata in a Qdrant collection based on
-        resumes.
+        resumes. Resumes are embedded `batch_size` at a time with at most `max_workers` requests in
+        flight, and each batch is upserted as soon as it is embedded.
         """
-        vectors = []
-        ids = []
-        for i, resume in enumerate(self.resumes):
-            vector, size = self.get_embedding(resume)
-            vectors.append(vector)
-            ids.append(i)
-        try:
-            self.qdrant.upsert(
-                collection_name=self.collection_name,
-                points=Batch(
-                    ids=ids,
-                    vectors=vectors,
-                    payloads=[{"text": resume} for resume in self.resumes],
-                ),
-            )
-        except Exception as e:
-            self.logger.error(
-                f"Error upserting the vectors to the qdrant collection: {e}",
-                exc_info=True,
-            )
+        starts = range(0, len(self.resumes), self.batch_size)
+        batches = [self.resumes[start : start + self.batch_size] for start in starts]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.embed_batch, batch) for batch in batches]
+            for start, batch, future in zip(starts, batches, futures):
+                try:
+                    vectors = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error getting embeddings: {e}", exc_info=True)
+                    continue
+                try:
+                    self.qdrant.upsert(
+                        collection_name=self.collection_name,
+                        points=Batch(
+                            ids=list(range(start, start + len(batch))),
+                            vectors=vectors,
+                            payloads=[{"text": resume} for resume in batch],
+                        ),
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error upserting the vectors to the qdrant collection: {e}",
+                        exc_info=True,
+                    )
 
     def search(self):
         """
@@ -0,0 +1,220 @@
+import json
+import logging
+import os
+import uuid
+
+from qdrant_client import QdrantClient, models
+
+from scripts.similarity.cosine_scorer import get_cosine_scorer
+from scripts.utils.Manifest import MANIFEST_FILE_NAME
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = os.environ.get("RESUME_INDEX_PATH", "data/index/qdrant")
+DEFAULT_COLLECTION_NAME = "resumes"
+
+
+def point_id(unique_id: str) -> str:
+    """
+    Map a document ID to a stable Qdrant point ID.
+
+    Args:
+        unique_id (str): The document ID stored in the parsed JSON.
+
+    Returns:
+        str: A UUID string, identical for the same document ID across runs.
+    """
+    try:
+        return str(uuid.UUID(unique_id))
+    except ValueError:
+        return str(uuid.uuid5(uuid.NAMESPACE_URL, unique_id))
+
+
+def document_text(document: dict) -> str:
+    """
+    Build the text embedded for a parsed document.
+
+    Args:
+        document (dict): The parsed resume or job description JSON.
+
+    Returns:
+        str: The extracted keywords joined by spaces.
+    """
+    return " ".join(document.get("extracted_keywords", []))
+
+
+class ResumeIndex:
+    """
+    A persistent vector index of processed resumes, stored with Qdrant's
+    embedded on-disk mode and updated incrementally by document ID.
+
+    The embedded mode locks its directory, so only one process may open an
+    index at a time.
+    """
+
+    def __init__(self, path: str = DEFAULT_INDEX_PATH, collection_name: str = DEFAULT_COLLECTION_NAME, scorer=None):
+        """
+        Initialize the ResumeIndex object.
+
+        Args:
+            path (str): The directory holding the index.
+            collection_name (str): The name of the Qdrant collection.
+            scorer (CosineScorer, optional): The scorer whose cached embedding
+                model is used. Defaults to the shared scorer.
+        """
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.collection_name = collection_name
+        self.scorer = scorer or get_cosine_scorer()
+        self.client = QdrantClient(path=path)
+
+    def _collection_exists(self) -> bool:
+        collections = self.client.get_collections().collections
+        return any(c.name == self.collection_name for c in collections)
+
+    def _ensure_collection(self, vector_size: int):
+        if not self._collection_exists():
+            self.client.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=models.VectorParams(
+                    size=vector_size, distance=models.Distance.COSINE
+                ),
+            )
+
+    def indexed_ids(self) -> set:
+        """
+        Get the document IDs already in the index.
+
+        Returns:
+            set: The `unique_id` of every indexed document.
+        """
+        if not self._collection_exists():
+            return set()
+        ids = set()
+        offset = None
+        while True:
+            points, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=1000,
+                offset=offset,
+                with_payload=["unique_id"],
+                with_vectors=False,
+            )
+            ids.update(point.payload["unique_id"] for point in points)
+            if offset is None:
+                return ids
+
+    def upsert(self, documents: dict, batch_size: int = 64) -> int:
+        """
+        Embed and upsert documents.
+
+        Args:
+            documents (dict): A dictionary mapping document IDs to
+                (file name, text) pairs.
+            batch_size (int): The number of documents embedded per call.
+
+        Returns:
+            int: The number of documents upserted.
+        """
+        items = list(documents.items())
+        for start in range(0, len(items), batch_size):
+            batch = items[start : start + batch_size]
+            vectors = self.scorer.embed([text for _, (_, text) in batch])
+            self._ensure_collection(vectors.shape[1])
+            self.client.upsert(
+                collection_name=self.collection_name,
+                points=[
+                    models.PointStruct(
+                        id=point_id(unique_id),
+                        vector=vector.tolist(),
+                        payload={"unique_id": unique_id, "file": file_name, "text": text[:30]},
+                    )
+                    for (unique_id, (file_name, text)), vector in zip(batch, vectors)
+                ],
+            )
+        return len(items)
+
+    def delete(self, unique_ids) -> int:
+        """
+        Remove documents from the index.
+
+        Args:
+            unique_ids (Iterable[str]): The document IDs to remove.
+
+        Returns:
+            int: The number of documents removed.
+        """
+        unique_ids = list(unique_ids)
+        if unique_ids and self._collection_exists():
+            self.client.delete(
+                collection_name=self.collection_name,
+                points_selector=models.PointIdsList(
+                    points=[point_id(unique_id) for unique_id in unique_ids]
+                ),
+            )
+        return len(unique_ids)
+
+    def sync_directory(self, directory: str, batch_size: int = 64) -> dict:
+        """
+        Bring the index in line with a directory of processed resume JSONs,
+        embedding only the documents it has not seen yet.
+
+        Args:
+            directory (str): The directory holding the processed JSON files.
+            batch_size (int): The number of documents embedded per call.
+
+        Returns:
+            dict: The number of documents `added`, `removed` and `unchanged`.
+        """
+        documents = {}
+        for file_name in sorted(os.listdir(directory)):
+            # The ingestion manifest and other dotfiles are not documents
+            if not file_name.endswith(".json") or file_name == MANIFEST_FILE_NAME or file_name.startswith("."):
+                continue
+            try:
+                with open(os.path.join(directory, file_name)) as f:
+                    document = json.load(f)
+                documents[document["unique_id"]] = (file_name, document_text(document))
+            except Exception as e:
+                logger.error(f"Error reading {file_name}: {e}")
+
+        indexed = self.indexed_ids()
+        added = self.upsert(
+            {uid: doc for uid, doc in documents.items() if uid not in indexed},
+            batch_size=batch_size,
+        )
+        removed = self.delete(indexed - documents.keys())
+        summary = {"added": added, "removed": removed, "unchanged": len(documents) - added}
+        logger.info(f"Synced resume index from {directory}: {summary}")
+        return summary
+
+    def search(self, job_description_string: str, limit: int = 10) -> list:
+        """
+        Find the resumes most similar to a job description.
+
+        Args:
+            job_description_string (str): The text of the job description.
+            limit (int): The number of candidates to return.
+
+        Returns:
+            list: Dictionaries with the `unique_id`, `file` and `score` of each
+            candidate, best first.
+        """
+        if not self._collection_exists():
+            return []
+        vector = self.scorer.embed([job_description_string])[0]
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            query_vector=vector.tolist(),
+            limit=limit,
+        )
+        return [
+            {"unique_id": hit.payload["unique_id"], "file": hit.payload["file"], "score": hit.score}
+            for hit in hits
+        ]
+
+    def close(self):
+        """
+        Release the on-disk index.
+        """
+        self.client.close()
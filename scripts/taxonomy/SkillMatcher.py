@@ -0,0 +1,145 @@
+import threading
+import weakref
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer
+from sklearn.preprocessing import normalize
+
+_matchers = weakref.WeakKeyDictionary()
+_matchers_lock = threading.Lock()
+
+
+class SkillMatcher:
+    """
+    A TF-IDF matcher over the skills of a taxonomy.
+
+    The term counts of every skill are computed once and kept as a sparse
+    matrix. Each call weights them with the IDF of that call's corpus, the
+    keywords plus the candidate skills, exactly as fitting a TfidfVectorizer
+    on them would, and compares them with a sparse matrix product. Nothing
+    is refitted or densified per call.
+    """
+
+    def __init__(self, taxonomy):
+        """
+        Initialize the SkillMatcher object.
+
+        Args:
+            taxonomy (SkillTaxonomy): The taxonomy whose skills are vectorized.
+        """
+        self.taxonomy = taxonomy
+        self.vectorizer = CountVectorizer()
+        self.analyzer = self.vectorizer.build_analyzer()
+        if taxonomy.skills:
+            try:
+                self.skill_counts = self.vectorizer.fit_transform(taxonomy.skills).tocsr()
+                self.vocabulary = self.vectorizer.vocabulary_
+            except ValueError:
+                # No skill has a single token
+                self.skill_counts = sp.csr_matrix((len(taxonomy.skills), 0), dtype=np.int64)
+                self.vocabulary = {}
+        else:
+            self.skill_counts = None
+            self.vocabulary = {}
+
+    def _keyword_counts(self, keywords):
+        # Term counts over the skill vocabulary, extended with the terms no
+        # skill contains, numbered after it.
+        vocabulary_size = len(self.vocabulary)
+        unknown = {}
+        indptr = [0]
+        indices = []
+        data = []
+        for keyword in keywords:
+            counts = {}
+            for term in self.analyzer(keyword):
+                column = self.vocabulary.get(term)
+                if column is None:
+                    column = unknown.setdefault(term, vocabulary_size + len(unknown))
+                counts[column] = counts.get(column, 0) + 1
+            indices.extend(counts)
+            data.extend(counts.values())
+            indptr.append(len(indices))
+        shape = (len(keywords), vocabulary_size + len(unknown))
+        return sp.csr_matrix((data, indices, indptr), shape=shape, dtype=np.float64)
+
+    def match(self, keywords, skill_ids=None, threshold=0.90):
+        """
+        Find the skills whose cosine similarity to any keyword reaches a threshold.
+
+        The result is the same as fitting a TfidfVectorizer on the keywords
+        followed by the candidate skills and comparing every pair.
+
+        Args:
+            keywords (list): The keywords to compare.
+            skill_ids (list, optional): The IDs of the candidate skills.
+                Defaults to every skill of the taxonomy.
+            threshold (float): The minimum cosine similarity.
+
+        Returns:
+            list: The matched skill IDs, ordered by the first keyword matching
+            them and then by their position in `skill_ids`.
+        """
+        if not keywords or self.skill_counts is None:
+            return []
+        if skill_ids is None:
+            skill_ids = range(self.skill_counts.shape[0])
+            candidates = self.skill_counts
+        else:
+            skill_ids = list(skill_ids)
+            if not skill_ids:
+                return []
+            candidates = self.skill_counts[skill_ids]
+
+        # Repeated keywords count towards the document frequencies only
+        multiplicity = {}
+        for keyword in keywords:
+            multiplicity[keyword] = multiplicity.get(keyword, 0) + 1
+        unique_keywords = list(multiplicity)
+        keyword_counts = self._keyword_counts(unique_keywords)
+        columns = keyword_counts.shape[1]
+        candidates = sp.csr_matrix(
+            (candidates.data.astype(np.float64), candidates.indices, candidates.indptr),
+            shape=(candidates.shape[0], columns),
+        )
+
+        # Smoothed IDF over every keyword and candidate, ln((1 + n) / (1 + df)) + 1
+        weights = np.repeat(np.fromiter(multiplicity.values(), dtype=np.float64), np.diff(keyword_counts.indptr))
+        document_frequency = np.bincount(keyword_counts.indices, weights=weights, minlength=columns)
+        document_frequency += np.bincount(candidates.indices, minlength=columns)
+        idf = np.log((1 + len(keywords) + candidates.shape[0]) / (1 + document_frequency)) + 1
+
+        keyword_vectors = normalize(keyword_counts.multiply(idf).tocsr())
+        skill_vectors = normalize(candidates.multiply(idf).tocsr())
+        similarity = (keyword_vectors @ skill_vectors.T).tocsr()
+        similarity.data[similarity.data < threshold] = 0
+        similarity.eliminate_zeros()
+        similarity.sort_indices()
+
+        matched = {}
+        for row in range(similarity.shape[0]):
+            for column in similarity.indices[similarity.indptr[row]:similarity.indptr[row + 1]]:
+                matched.setdefault(skill_ids[column], None)
+        return list(matched)
+
+
+def get_skill_matcher(taxonomy) -> SkillMatcher:
+    """
+    Get the SkillMatcher of a taxonomy, building it on first use.
+
+    Args:
+        taxonomy (SkillTaxonomy): The compiled taxonomy.
+
+    Returns:
+        SkillMatcher: The matcher shared by every user of the taxonomy.
+    """
+    matcher = _matchers.get(taxonomy)
+    if matcher is not None:
+        return matcher
+    with _matchers_lock:
+        matcher = _matchers.get(taxonomy)
+        if matcher is None:
+            matcher = SkillMatcher(taxonomy)
+            _matchers[taxonomy] = matcher
+    return matcher
@@ -0,0 +1,632 @@
+import bisect
+import hashlib
+import json
+import operator
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+
+import numpy as np
+from scipy import sparse
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_META_FILE = "meta.json"
+SNAPSHOT_ARRAYS = (
+    "title_data",
+    "title_offsets",
+    "title_order",
+    "skill_data",
+    "skill_offsets",
+    "skill_order",
+    "title_skill_indptr",
+    "title_skill_indices",
+    "skill_title_indptr",
+    "skill_title_indices",
+)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill or title for comparison.
+
+    Args:
+        skill (str): The skill as written in the taxonomy.
+
+    Returns:
+        str: The lowercased skill with runs of whitespace collapsed.
+    """
+    return " ".join(str(skill).lower().split())
+
+
+class StringTable(Sequence):
+    """
+    An immutable table of strings stored as one UTF-8 buffer and an offsets
+    array, so it can be memory-mapped. Strings are decoded and interned on
+    access.
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        """
+        Initialize the StringTable object.
+
+        Args:
+            data (np.ndarray): The concatenated UTF-8 bytes of every string.
+            offsets (np.ndarray): The start of every string in `data`,
+                followed by the end of the last one.
+        """
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_strings(cls, strings):
+        """
+        Build a table from Python strings.
+
+        Args:
+            strings (Iterable[str]): The strings, in ID order.
+
+        Returns:
+            StringTable: The table.
+        """
+        encoded = [string.encode("utf-8") for string in strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(string) for string in encoded], out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8).copy()
+        return cls(data, offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string table index out of range")
+        start, end = self.offsets[index], self.offsets[index + 1]
+        return sys.intern(self.data[start:end].tobytes().decode("utf-8"))
+
+    def __iter__(self):
+        data = self.data.tobytes()
+        offsets = self.offsets.tolist()
+        for start, end in zip(offsets, offsets[1:]):
+            yield sys.intern(data[start:end].decode("utf-8"))
+
+    def encoded(self, index: int) -> bytes:
+        """
+        Get the UTF-8 bytes of a string without decoding them.
+
+        Args:
+            index (int): The string ID.
+
+        Returns:
+            bytes: The encoded string.
+        """
+        return self.data[self.offsets[index]:self.offsets[index + 1]].tobytes()
+
+    def sorted_order(self) -> np.ndarray:
+        """
+        Get the string IDs in sorted order. UTF-8 byte order is the same as
+        Python string order.
+
+        Returns:
+            np.ndarray: The IDs sorted by their strings.
+        """
+        return np.array(sorted(range(len(self)), key=self.encoded), dtype=np.int32)
+
+
+class _EncodedKeys(Sequence):
+    # The encoded strings of a table in sorted order, for bisect
+    def __init__(self, table: StringTable, order: np.ndarray):
+        self.table = table
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, index: int) -> bytes:
+        return self.table.encoded(self.order[index])
+
+
+class StringIndex(Mapping):
+    """
+    A read-only mapping of the strings of a StringTable to their IDs.
+
+    Lookups binary-search a sorted permutation of the IDs and compare the
+    encoded strings in place, so a memory-mapped table is never decoded into
+    Python objects.
+    """
+
+    def __init__(self, table: StringTable, order: np.ndarray = None):
+        """
+        Initialize the StringIndex object.
+
+        Args:
+            table (StringTable): The strings, which must be distinct.
+            order (np.ndarray, optional): The IDs sorted by their strings, as
+                returned by `StringTable.sorted_order`. Computed when not given.
+        """
+        self.table = table
+        self.order = order if order is not None else table.sorted_order()
+        self._keys = _EncodedKeys(table, self.order)
+
+    def __getitem__(self, key) -> int:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        encoded = key.encode("utf-8")
+        position = bisect.bisect_left(self._keys, encoded)
+        if position == len(self._keys) or self._keys[position] != encoded:
+            raise KeyError(key)
+        return int(self.order[position])
+
+    def __iter__(self):
+        return iter(self.table)
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+
+class _NormalizedStrings(Sequence):
+    # The normalized form of every string of a table, computed on access
+    def __init__(self, table: StringTable):
+        self.table = table
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self[i] for i in range(*index.indices(len(self))))
+        return normalize_skill(self.table[index])
+
+
+def _transpose(indptr: np.ndarray, indices: np.ndarray, columns: int):
+    """Build the CSR arrays of the transposed membership, without duplicates."""
+    rows = np.repeat(np.arange(len(indptr) - 1, dtype=np.int32), np.diff(indptr))
+    pairs = np.unique(np.stack([indices.astype(np.int64), rows.astype(np.int64)], axis=1), axis=0)
+    transposed_indptr = np.zeros(columns + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=columns), out=transposed_indptr[1:])
+    return transposed_indptr, pairs[:, 1].astype(np.int32)
+
+
+class SkillTaxonomy:
+    """
+    An immutable, compact index over a job-title-to-skills taxonomy.
+
+    Titles and skills are interned string tables with integer IDs, and title
+    to skill membership is kept as CSR arrays in both directions. The arrays
+    can be saved as a binary snapshot and memory-mapped back, so loading a
+    large taxonomy costs neither parsing time nor private memory. The
+    string-to-ID maps of a loaded snapshot search the mapped strings in
+    place. Derived indexes such as SkillMatcher and TitleIndex are still
+    built in memory, once per process.
+    """
+
+    def __init__(
+        self,
+        titles: StringTable,
+        skills: StringTable,
+        title_skill_indptr: np.ndarray,
+        title_skill_indices: np.ndarray,
+        skill_title_indptr: np.ndarray = None,
+        skill_title_indices: np.ndarray = None,
+    ):
+        """
+        Initialize the SkillTaxonomy object. Use `from_records`, `from_json`
+        or `load` to build one.
+
+        Args:
+            titles (StringTable): The job titles, in ID order.
+            skills (StringTable): The skills, in ID order.
+            title_skill_indptr (np.ndarray): The CSR row pointers of the
+                title to skill membership.
+            title_skill_indices (np.ndarray): The skill IDs of every title,
+                in taxonomy order.
+            skill_title_indptr (np.ndarray, optional): The CSR row pointers
+                of the skill to title membership.
+            skill_title_indices (np.ndarray, optional): The title IDs of
+                every skill, in ascending order. Derived when not given.
+        """
+        self.titles = titles
+        self.skills = skills
+        self.title_skill_indptr = title_skill_indptr
+        self.title_skill_indices = title_skill_indices
+        if skill_title_indptr is None or skill_title_indices is None:
+            skill_title_indptr, skill_title_indices = _transpose(
+                title_skill_indptr, title_skill_indices, len(skills)
+            )
+        self.skill_title_indptr = skill_title_indptr
+        self.skill_title_indices = skill_title_indices
+        self._title_ids = None
+        self._skill_ids = None
+        self._title_order = None
+        self._skill_order = None
+        self._title_skill_matrix = None
+        self._normalized_skill_ids = None
+        self._fingerprint = None
+
+    @classmethod
+    def from_records(cls, records):
+        """
+        Build a taxonomy from its records.
+
+        Args:
+            records (list): Dictionaries with an `id` (the job title) and a
+                list of `skills`.
+
+        Returns:
+            SkillTaxonomy: The compiled taxonomy.
+        """
+        titles = []
+        title_ids = {}
+        skills = []
+        skill_ids = {}
+        indptr = [0]
+        indices = []
+        for record in records:
+            title = sys.intern(str(record["id"]))
+            if title in title_ids:
+                raise ValueError(f"Duplicate job title in taxonomy: {title}")
+            title_ids[title] = len(titles)
+            titles.append(title)
+            for skill in record.get("skills", []):
+                skill_id = skill_ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(skills)
+                    skill_ids[skill] = skill_id
+                    skills.append(sys.intern(skill))
+                indices.append(skill_id)
+            indptr.append(len(indices))
+
+        taxonomy = cls(
+            StringTable.from_strings(titles),
+            StringTable.from_strings(skills),
+            np.array(indptr, dtype=np.int64),
+            np.array(indices, dtype=np.int32),
+        )
+        taxonomy._title_ids = MappingProxyType(title_ids)
+        taxonomy._skill_ids = MappingProxyType(skill_ids)
+        return taxonomy
+
+    @classmethod
+    def from_json(cls, json_filepath: str):
+        """
+        Build a taxonomy from a JSON file.
+
+        Args:
+            json_filepath (str): A JSON list of `{"id": title, "skills": [...]}`
+                records, or an object mapping titles to skill lists.
+
+        Returns:
+            SkillTaxonomy: The compiled taxonomy.
+        """
+        with open(json_filepath, "r") as file:
+            data = json.load(file)
+        if isinstance(data, dict):
+            data = [{"id": title, "skills": skills} for title, skills in data.items()]
+        elif not isinstance(data, list):
+            raise ValueError("Unsupported JSON format")
+        return cls.from_records(data)
+
+    def save(self, directory: str):
+        """
+        Write the taxonomy as a binary snapshot of `.npy` arrays, replacing
+        any snapshot already in the directory.
+
+        Args:
+            directory (str): The snapshot directory.
+        """
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix=".taxonomy-", dir=parent)
+        try:
+            arrays = {
+                "title_data": self.titles.data,
+                "title_offsets": self.titles.offsets,
+                "title_order": self._title_order if self._title_order is not None else self.titles.sorted_order(),
+                "skill_data": self.skills.data,
+                "skill_offsets": self.skills.offsets,
+                "skill_order": self._skill_order if self._skill_order is not None else self.skills.sorted_order(),
+                "title_skill_indptr": self.title_skill_indptr,
+                "title_skill_indices": self.title_skill_indices,
+                "skill_title_indptr": self.skill_title_indptr,
+                "skill_title_indices": self.skill_title_indices,
+            }
+            for name, array in arrays.items():
+                np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(array))
+            meta = {
+                "version": SNAPSHOT_VERSION,
+                "titles": len(self.titles),
+                "skills": len(self.skills),
+                "fingerprint": self.fingerprint,
+            }
+            with open(os.path.join(staging, SNAPSHOT_META_FILE), "w") as file:
+                json.dump(meta, file)
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+            os.replace(staging, directory)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    @classmethod
+    def load(cls, directory: str, mmap_mode: str = "r"):
+        """
+        Load a taxonomy from a binary snapshot.
+
+        Args:
+            directory (str): The snapshot directory written by `save`.
+            mmap_mode (str, optional): How the arrays are memory-mapped, as
+                for `np.load`. Pass None to read them into memory.
+
+        Returns:
+            SkillTaxonomy: The taxonomy, backed by the snapshot files.
+        """
+        with open(os.path.join(directory, SNAPSHOT_META_FILE), "r") as file:
+            meta = json.load(file)
+        if meta.get("version") not in (1, SNAPSHOT_VERSION):
+            raise ValueError(f"Unsupported taxonomy snapshot version: {meta.get('version')}")
+        arrays = {
+            name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode)
+            for name in SNAPSHOT_ARRAYS
+            # Version 1 snapshots have no sort orders, which are then computed
+            if os.path.exists(os.path.join(directory, f"{name}.npy"))
+        }
+        taxonomy = cls(
+            StringTable(arrays["title_data"], arrays["title_offsets"]),
+            StringTable(arrays["skill_data"], arrays["skill_offsets"]),
+            arrays["title_skill_indptr"],
+            arrays["title_skill_indices"],
+            arrays["skill_title_indptr"],
+            arrays["skill_title_indices"],
+        )
+        taxonomy._title_order = arrays.get("title_order")
+        taxonomy._skill_order = arrays.get("skill_order")
+        # Older snapshots have no fingerprint, which is then computed
+        taxonomy._fingerprint = meta.get("fingerprint")
+        return taxonomy
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A hash of the titles, skills and their membership, computed once.
+        A JSON file and a snapshot of it have the same fingerprint, so it
+        can key results that depend on the taxonomy.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            arrays = {
+                "title_data": self.titles.data,
+                "title_offsets": self.titles.offsets,
+                "skill_data": self.skills.data,
+                "skill_offsets": self.skills.offsets,
+                "title_skill_indptr": self.title_skill_indptr,
+                "title_skill_indices": self.title_skill_indices,
+            }
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                digest.update(f"{name}:{array.dtype.str}:{array.shape}".encode("utf-8"))
+                digest.update(memoryview(array).cast("B"))
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    @property
+    def title_ids(self):
+        """A read-only mapping of job title to title ID."""
+        if self._title_ids is None:
+            self._title_ids = StringIndex(self.titles, self._title_order)
+        return self._title_ids
+
+    @property
+    def skill_ids(self):
+        """A read-only mapping of skill to skill ID."""
+        if self._skill_ids is None:
+            self._skill_ids = StringIndex(self.skills, self._skill_order)
+        return self._skill_ids
+
+    @property
+    def normalized_skills(self) -> Sequence:
+        """The normalized form of every skill, in ID order, computed on access."""
+        return _NormalizedStrings(self.skills)
+
+    @property
+    def title_skill_matrix(self):
+        """A binary sparse title-by-skill matrix over the CSR membership."""
+        if self._title_skill_matrix is None:
+            # Copied, since summing duplicates sorts the indices in place and
+            # a loaded snapshot's arrays are read-only memory maps
+            matrix = sparse.csr_matrix(
+                (
+                    np.ones(len(self.title_skill_indices), dtype=np.float32),
+                    np.array(self.title_skill_indices),
+                    np.array(self.title_skill_indptr),
+                ),
+                shape=(len(self.titles), len(self.skills)),
+            )
+            matrix.sum_duplicates()
+            matrix.data[:] = 1
+            self._title_skill_matrix = matrix
+        return self._title_skill_matrix
+
+    def skill_ids_for_keywords(self, keywords) -> list:
+        """
+        Find the skills named exactly by some keywords, ignoring case and
+        whitespace. Unlike fuzzy matching, "docker" finds "Docker" but not
+        "Docker Security".
+
+        Args:
+            keywords (Iterable[str]): The keywords to look up.
+
+        Returns:
+            list: The IDs of the matched skills, by first matching keyword.
+        """
+        if self._normalized_skill_ids is None:
+            normalized_skill_ids = {}
+            for skill_id, skill in enumerate(self.skills):
+                normalized_skill_ids.setdefault(normalize_skill(skill), []).append(skill_id)
+            self._normalized_skill_ids = normalized_skill_ids
+        matched = {}
+        for keyword in keywords:
+            for skill_id in self._normalized_skill_ids.get(normalize_skill(keyword), ()):
+                matched.setdefault(skill_id, None)
+        return list(matched)
+
+    def best_fit_titles(self, skill_ids, limit: int = 5) -> list:
+        """
+        Score a set of skills against every job title at once.
+
+        Args:
+            skill_ids (Iterable[int]): The IDs of the skills someone has.
+            limit (int): The number of titles to return.
+
+        Returns:
+            list: Dictionaries with the `title`, its `title_id`, the number of
+            `matched_skills` and the `coverage`, the share of the title's
+            skills that were matched. Best coverage first, then most matched
+            skills; titles matching no skill are left out.
+        """
+        matrix = self.title_skill_matrix
+        skills = np.zeros(matrix.shape[1], dtype=np.float32)
+        skills[np.fromiter(set(skill_ids), dtype=np.int64)] = 1
+        matched = np.rint(matrix @ skills).astype(np.int64)
+        sizes = np.diff(matrix.indptr)
+        coverage = np.divide(matched, sizes, out=np.zeros(len(sizes)), where=sizes > 0)
+        order = np.lexsort((-matched, -coverage))[:limit]
+        return [
+            {
+                "title": self.titles[title_id],
+                "title_id": int(title_id),
+                "matched_skills": int(matched[title_id]),
+                "coverage": float(coverage[title_id]),
+            }
+            for title_id in order
+            if matched[title_id] > 0
+        ]
+
+    def __contains__(self, title) -> bool:
+        return title in self.title_ids
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def skill_ids_for_title(self, title: str) -> tuple:
+        """
+        Get the skill IDs of a job title.
+
+        Args:
+            title (str): The job title.
+
+        Returns:
+            tuple: The skill IDs of the title, in taxonomy order.
+        """
+        title_id = self.title_ids[title]
+        start, end = self.title_skill_indptr[title_id], self.title_skill_indptr[title_id + 1]
+        return tuple(self.title_skill_indices[start:end].tolist())
+
+    def skills_for_title(self, title: str) -> tuple:
+        """
+        Get the skills of a job title, in taxonomy order.
+
+        Args:
+            title (str): The job title.
+
+        Returns:
+            tuple: The skills of the title.
+        """
+        skills = self.skills
+        return tuple(skills[skill_id] for skill_id in self.skill_ids_for_title(title))
+
+    def titles_for_skill(self, skill: str) -> tuple:
+        """
+        Get the job titles requiring a skill.
+
+        Args:
+            skill (str): The skill as written in the taxonomy.
+
+        Returns:
+            tuple: The job titles listing the skill.
+        """
+        skill_id = self.skill_ids.get(skill)
+        if skill_id is None:
+            return ()
+        start, end = self.skill_title_indptr[skill_id], self.skill_title_indptr[skill_id + 1]
+        titles = self.titles
+        return tuple(titles[title_id] for title_id in self.skill_title_indices[start:end].tolist())
+
+    def normalized(self, skill: str) -> str:
+        """
+        Get the normalized form of a skill.
+
+        Args:
+            skill (str): The skill as written in the taxonomy.
+
+        Returns:
+            str: The normalized skill.
+        """
+        return normalize_skill(skill)
+
+    def to_records(self) -> list:
+        """
+        Convert the taxonomy back to its JSON record form.
+
+        Returns:
+            list: Dictionaries with an `id` and a list of `skills`.
+        """
+        return [
+            {"id": title, "skills": list(self.skills_for_title(title))}
+            for title in self.titles
+        ]
+
+
+def load_taxonomy(path: str) -> SkillTaxonomy:
+    """
+    Load a taxonomy, compiling it once per process and file version.
+
+    Args:
+        path (str): The path of the taxonomy JSON file, or of a snapshot
+            directory written by `SkillTaxonomy.save`, which is memory-mapped.
+
+    Returns:
+        SkillTaxonomy: The shared compiled taxonomy.
+    """
+    is_snapshot = os.path.isdir(path)
+    stat = os.stat(os.path.join(path, SNAPSHOT_META_FILE) if is_snapshot else path)
+    path = os.path.abspath(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    # Only the latest version of each file is kept
+    entry = _cache.get(path)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    with _cache_lock:
+        entry = _cache.get(path)
+        if entry is None or entry[0] != version:
+            taxonomy = SkillTaxonomy.load(path) if is_snapshot else SkillTaxonomy.from_json(path)
+            entry = (version, taxonomy)
+            _cache[path] = entry
+    return entry[1]
+
+
+def build_snapshot(json_filepath: str, directory: str) -> SkillTaxonomy:
+    """
+    Compile a taxonomy JSON file into a binary snapshot.
+
+    Args:
+        json_filepath (str): The path of the taxonomy JSON file.
+        directory (str): The snapshot directory to write.
+
+    Returns:
+        SkillTaxonomy: The compiled taxonomy.
+    """
+    taxonomy = SkillTaxonomy.from_json(json_filepath)
+    taxonomy.save(directory)
+    return taxonomy
+
@@ -0,0 +1,179 @@
+import threading
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from scripts.utils.ModelRegistry import get_nlp
+
+DEFAULT_MAX_CACHED_TOKENS = 100_000
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+class SoftSkillIndex:
+    """
+    A precomputed word-vector index over a soft-skills taxonomy.
+
+    The unit vectors of the soft-skill words are built once. Each distinct
+    token seen in the input is compared against them once, and the skill words
+    it matches are kept in an LRU lookup table, so repeated tokens across
+    calls cost a dictionary hit.
+    """
+
+    def __init__(self, skills, nlp=None, threshold=0.90, max_cached_tokens=DEFAULT_MAX_CACHED_TOKENS):
+        """
+        Initialize the SoftSkillIndex object.
+
+        Args:
+            skills (Iterable[str]): The soft skills of the taxonomy.
+            nlp (spacy.Language, optional): The pipeline providing the word
+                vectors. Defaults to the shared `en_core_web_md` pipeline.
+            threshold (float): A token matches a skill word when their cosine
+                similarity is above this value.
+            max_cached_tokens (int): The number of distinct tokens whose
+                matches are remembered.
+        """
+        self.skills = tuple(dict.fromkeys(skills))
+        self.nlp = nlp or get_nlp("en_core_web_md")
+        self.threshold = threshold
+        self.max_cached_tokens = max_cached_tokens
+
+        # The same word in several skills counts once per occurrence.
+        multiplicity = {}
+        vectors = []
+        for token in self.nlp.make_doc(" ".join(self.skills)):
+            if not token.has_vector:
+                continue
+            if token.text not in multiplicity:
+                multiplicity[token.text] = 0
+                vectors.append(token.vector)
+            multiplicity[token.text] += 1
+        self.skill_words = tuple(multiplicity)
+        self.skill_multiplicity = tuple(multiplicity.values())
+        self.skill_vectors = self._unit(np.array(vectors, dtype=np.float32).reshape(len(vectors), self.nlp.vocab.vectors_length))
+        self.skill_vectors.setflags(write=False)
+
+        self._token_matches = OrderedDict()
+        self._lock = threading.Lock()
+        self._phrase_matcher = None
+
+    @staticmethod
+    def _unit(vectors):
+        return vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-10)
+
+    def _match_new_tokens(self, tokens) -> list:
+        """Compare tokens not in the lookup table against every skill word."""
+        matches = [()] * len(tokens)
+        candidates = [
+            i for i, token in enumerate(tokens)
+            if not token.is_stop and not token.is_punct and token.has_vector
+        ]
+        if candidates and len(self.skill_words):
+            vectors = self._unit(np.array([tokens[i].vector for i in candidates], dtype=np.float32))
+            similarity = vectors @ self.skill_vectors.T
+            for i, row in zip(candidates, similarity):
+                matches[i] = tuple(np.flatnonzero(row > self.threshold).tolist())
+        return matches
+
+    def count_matches(self, texts) -> dict:
+        """
+        Count the soft-skill words similar to the tokens of some texts.
+
+        Args:
+            texts (list): The texts to scan, e.g. extracted keywords.
+
+        Returns:
+            dict: The number of similar token and skill word pairs per skill
+            word, ordered by the first token matching it.
+        """
+        doc = self.nlp.make_doc(" ".join(texts))
+        token_counts = Counter()
+        first_tokens = {}
+        for token in doc:
+            token_counts[token.text] += 1
+            first_tokens.setdefault(token.text, token)
+
+        with self._lock:
+            matches = {}
+            missing = []
+            for text in token_counts:
+                found = self._token_matches.get(text)
+                if found is None:
+                    missing.append(text)
+                else:
+                    self._token_matches.move_to_end(text)
+                    matches[text] = found
+            for text, found in zip(missing, self._match_new_tokens([first_tokens[text] for text in missing])):
+                matches[text] = found
+                self._token_matches[text] = found
+            while len(self._token_matches) > self.max_cached_tokens:
+                self._token_matches.popitem(last=False)
+
+        counts = {}
+        for text, count in token_counts.items():
+            for skill_idx in matches[text]:
+                skill_word = self.skill_words[skill_idx]
+                counts[skill_word] = counts.get(skill_word, 0) + count * self.skill_multiplicity[skill_idx]
+        return counts
+
+    @property
+    def phrase_matcher(self):
+        """
+        A case-insensitive PhraseMatcher over every soft skill, compiled on
+        first use and reused by every call.
+        """
+        if self._phrase_matcher is None:
+            with self._lock:
+                if self._phrase_matcher is None:
+                    from spacy.matcher import PhraseMatcher
+
+                    matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+                    for skill, pattern in zip(self.skills, self.nlp.tokenizer.pipe(self.skills)):
+                        if len(pattern):
+                            matcher.add(skill, [pattern])
+                    self._phrase_matcher = matcher
+        return self._phrase_matcher
+
+    def find(self, text: str) -> list:
+        """
+        Find the soft skills mentioned in a text in a single scan.
+
+        Args:
+            text (str): The text to scan.
+
+        Returns:
+            list: Dictionaries with the matched `skill`, its `count` and the
+            character `offsets` of each mention, ordered by first mention.
+        """
+        doc = self.nlp.make_doc(text)
+        found = {}
+        for match_id, start, end in sorted(self.phrase_matcher(doc), key=lambda match: (match[1], match[2])):
+            skill = self.nlp.vocab.strings[match_id]
+            span = doc[start:end]
+            entry = found.setdefault(skill, {"skill": skill, "count": 0, "offsets": []})
+            entry["count"] += 1
+            entry["offsets"].append((span.start_char, span.end_char))
+        return list(found.values())
+
+
+def get_soft_skill_index(skills) -> SoftSkillIndex:
+    """
+    Get the SoftSkillIndex of a set of soft skills, building it on first use.
+
+    Args:
+        skills (Iterable[str]): The soft skills of the taxonomy.
+
+    Returns:
+        SoftSkillIndex: The index shared by every user of the same skills.
+    """
+    key = tuple(skills)
+    index = _indexes.get(key)
+    if index is not None:
+        return index
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = SoftSkillIndex(key)
+            _indexes[key] = index
+    return index
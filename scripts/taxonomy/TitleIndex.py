@@ -0,0 +1,175 @@
+import heapq
+import threading
+import weakref
+from collections.abc import Sequence
+
+import numpy as np
+from fuzzywuzzy import fuzz, process, utils
+from rapidfuzz import fuzz as rf_fuzz
+
+from .SkillTaxonomy import StringTable
+
+DEFAULT_SHORTLIST_SIZE = 64
+# Postings read per query, taken from the rarest query trigrams first
+DEFAULT_MAX_POSTINGS = 50_000
+
+_indexes = weakref.WeakKeyDictionary()
+_indexes_lock = threading.Lock()
+
+
+def process_title(title: str) -> str:
+    """
+    Normalize a title exactly as `process.extract` does before `fuzz.WRatio`.
+
+    Args:
+        title (str): The raw title or query.
+
+    Returns:
+        str: The lowercased ASCII title with punctuation replaced by spaces.
+    """
+    return utils.full_process(utils.full_process(title), force_ascii=True)
+
+
+def title_trigrams(processed_title: str) -> set:
+    """
+    Get the character trigrams of a processed title, padded so that word
+    boundaries form trigrams too.
+
+    Args:
+        processed_title (str): The title after `process_title`.
+
+    Returns:
+        set: The distinct trigrams.
+    """
+    padded = f"  {processed_title} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TitleIndex:
+    """
+    A prebuilt index for fuzzy job-title lookup over large title catalogs.
+
+    Titles are normalized once and a trigram index shortlists the titles
+    sharing the most trigrams with the query. Only the shortlist is scored
+    with `WRatio`. Catalogs no larger than the shortlist are scored in full
+    with fuzzywuzzy, giving exactly the `process.extract` results; larger
+    ones use the much faster rapidfuzz `WRatio`, whose rounded scores can
+    differ from fuzzywuzzy's by a point or two.
+    """
+
+    def __init__(
+        self,
+        titles,
+        shortlist_size: int = DEFAULT_SHORTLIST_SIZE,
+        max_postings: int = DEFAULT_MAX_POSTINGS,
+    ):
+        """
+        Initialize the TitleIndex object.
+
+        Args:
+            titles (Iterable[str]): The job titles, identified by position.
+            shortlist_size (int): The number of candidates scored per query.
+            max_postings (int): The number of trigram postings read per query.
+                Common trigrams past this budget are skipped.
+        """
+        # A StringTable of titles is kept as is instead of decoded into a tuple
+        self.titles = titles if isinstance(titles, Sequence) else tuple(titles)
+        self.shortlist_size = max(1, shortlist_size)
+        self.max_postings = max_postings
+
+        processed_titles = []
+        postings = {}
+        sizes = []
+        for title_id, title in enumerate(self.titles):
+            processed = process_title(title)
+            processed_titles.append(processed)
+            trigrams = title_trigrams(processed)
+            sizes.append(len(trigrams))
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(title_id)
+        self.processed_titles = StringTable.from_strings(processed_titles)
+        self.postings = {trigram: np.array(ids, dtype=np.intp) for trigram, ids in postings.items()}
+        self.trigram_counts = np.array(sizes, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def shortlist(self, processed_query: str) -> np.ndarray:
+        """
+        Get the IDs of the titles most similar to a query by trigram overlap.
+
+        Args:
+            processed_query (str): The query after `process_title`.
+
+        Returns:
+            np.ndarray: Up to `shortlist_size` title IDs, in ascending order.
+        """
+        if len(self.titles) <= self.shortlist_size:
+            return np.arange(len(self.titles))
+        trigrams = title_trigrams(processed_query)
+        postings = sorted(
+            (self.postings[trigram] for trigram in trigrams if trigram in self.postings),
+            key=len,
+        )
+        hits = []
+        read = 0
+        for ids in postings:
+            if hits and read + len(ids) > self.max_postings:
+                break
+            hits.append(ids)
+            read += len(ids)
+        if not hits:
+            return np.arange(self.shortlist_size)
+        overlap = np.bincount(np.concatenate(hits), minlength=len(self.titles)).astype(np.float32)
+        # Dice coefficient, so short titles containing the query rank first
+        dice = overlap / (self.trigram_counts + len(trigrams))
+        candidates = np.argpartition(-dice, self.shortlist_size - 1)[:self.shortlist_size]
+        return np.sort(candidates)
+
+    def search(self, job_title: str, limit: int = 3) -> list:
+        """
+        Find the titles best matching a job title.
+
+        Args:
+            job_title (str): The job title to look up.
+            limit (int): The number of matches to return.
+
+        Returns:
+            list: `(title, score, title_id)` tuples, best first, in the shape
+            `process.extract` returns for a dictionary of choices.
+        """
+        if not utils.full_process(job_title):
+            return process.extract(job_title, dict(enumerate(self.titles)), limit=limit)
+        processed_query = process_title(job_title)
+        if len(self.titles) <= self.shortlist_size:
+            def score(title):
+                return fuzz.WRatio(processed_query, title, full_process=False)
+        else:
+            def score(title):
+                return int(round(rf_fuzz.WRatio(processed_query, title)))
+        scored = (
+            (self.titles[title_id], score(self.processed_titles[title_id]), int(title_id))
+            for title_id in self.shortlist(processed_query)
+        )
+        return heapq.nlargest(limit, scored, key=lambda match: match[1])
+
+
+def get_title_index(taxonomy) -> TitleIndex:
+    """
+    Get the TitleIndex of a taxonomy, building it on first use.
+
+    Args:
+        taxonomy (SkillTaxonomy): The compiled taxonomy.
+
+    Returns:
+        TitleIndex: The index shared by every user of the taxonomy.
+    """
+    index = _indexes.get(taxonomy)
+    if index is not None:
+        return index
+    with _indexes_lock:
+        index = _indexes.get(taxonomy)
+        if index is None:
+            index = TitleIndex(taxonomy.titles)
+            _indexes[taxonomy] = index
+    return index
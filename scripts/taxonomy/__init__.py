@@ -0,0 +1,4 @@
+from .SkillMatcher import SkillMatcher, get_skill_matcher
+from .SkillTaxonomy import SkillTaxonomy, StringIndex, StringTable, build_snapshot, load_taxonomy, normalize_skill
+from .SoftSkillIndex import SoftSkillIndex, get_soft_skill_index
+from .TitleIndex import TitleIndex, get_title_index
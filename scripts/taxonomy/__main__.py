@@ -0,0 +1,12 @@
+import argparse
+
+from scripts.taxonomy import build_snapshot
+
+parser = argparse.ArgumentParser(description="Compile a job skills taxonomy into a binary snapshot.")
+parser.add_argument("json_filepath", help="The taxonomy JSON file, e.g. data/job_skills.json.")
+parser.add_argument("directory", help="The snapshot directory to write.")
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    taxonomy = build_snapshot(args.json_filepath, args.directory)
+    print(f"Wrote {len(taxonomy.titles)} titles and {len(taxonomy.skills)} skills to {args.directory}")
@@ -0,0 +1,350 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+DEFAULT_QUEUE_PATH = os.environ.get("JOB_QUEUE_PATH", "data/cache/jobs.sqlite3")
+DEFAULT_MAX_PENDING = int(os.environ.get("JOB_QUEUE_MAX_PENDING", 100))
+DEFAULT_LEASE_SECONDS = 600
+DEFAULT_MAX_ATTEMPTS = 3
+# How long finished jobs are kept for clients to fetch their results
+DEFAULT_RETENTION_SECONDS = float(os.environ.get("JOB_QUEUE_RETENTION_SECONDS", 24 * 60 * 60))
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobQueue:
+    """
+    A durable job queue stored in SQLite, shareable by several processes.
+
+    A claimed job is leased to its worker. If the worker dies, the lease
+    expires and the job is handed out again, so accepted jobs survive
+    restarts.
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_QUEUE_PATH,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Initialize the JobQueue object.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            max_pending (int): The number of queued and running jobs above
+                which new submissions are refused.
+            lease_seconds (float): How long a worker may hold a job before it
+                is handed out again.
+            max_attempts (int): The number of times a job is handed out
+                before it is given up as failed.
+        """
+        self.path = path
+        self.max_pending = max_pending
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT NOT NULL, "
+                "data BLOB, result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, "
+                "created_at REAL NOT NULL, started_at REAL, finished_at REAL, "
+                "lease_expires REAL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)")
+
+    def _connect(self):
+        # A short-lived connection per call keeps the queue safe to use after fork.
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _transaction(self, work):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = work(conn)
+                conn.execute("COMMIT")
+                return result
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        finally:
+            conn.close()
+
+    def submit(self, payload: dict, data: bytes = None) -> str:
+        """
+        Add a job to the queue.
+
+        Args:
+            payload (dict): The JSON-serialisable job parameters.
+            data (bytes, optional): A binary attachment, e.g. an uploaded file.
+
+        Returns:
+            str: The ID of the new job.
+
+        Raises:
+            QueueFull: If `max_pending` jobs are already queued or running.
+        """
+        job_id = uuid.uuid4().hex
+
+        def insert(conn):
+            pending = conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchone()[0]
+            if pending >= self.max_pending:
+                raise QueueFull(f"{pending} jobs are already pending")
+            conn.execute(
+                "INSERT INTO jobs (id, status, payload, data, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job_id, QUEUED, json.dumps(payload), data, time.time()),
+            )
+
+        self._transaction(insert)
+        return job_id
+
+    def claim(self):
+        """
+        Lease the oldest waiting job, or a running job whose lease expired.
+
+        Returns:
+            dict: The job's `id`, `payload`, `data` and `attempts`, or None if
+            no job is waiting.
+        """
+        def take(conn):
+            now = time.time()
+            while True:
+                row = conn.execute(
+                    "SELECT id, payload, data, attempts FROM jobs "
+                    "WHERE status = ? OR (status = ? AND lease_expires < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (QUEUED, RUNNING, now),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[3] < self.max_attempts:
+                    break
+                # Its workers kept dying, so stop handing it out.
+                conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ?, data = NULL, "
+                    "lease_expires = NULL WHERE id = ?",
+                    (FAILED, f"Job abandoned after {row[3]} attempts", now, row[0]),
+                )
+            conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE id = ?",
+                (RUNNING, now, now + self.lease_seconds, row[0]),
+            )
+            return {"id": row[0], "payload": json.loads(row[1]), "data": row[2], "attempts": row[3] + 1}
+
+        return self._transaction(take)
+
+    def _finish(self, job_id: str, status: str, result=None, error: str = None):
+        def update(conn):
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, "
+                "data = NULL, lease_expires = NULL WHERE id = ?",
+                (status, json.dumps(result) if result is not None else None, error, time.time(), job_id),
+            )
+
+        self._transaction(update)
+
+    def complete(self, job_id: str, result):
+        """
+        Mark a job as done and store its result.
+
+        Args:
+            job_id (str): The job ID.
+            result (object): The JSON-serialisable result.
+        """
+        self._finish(job_id, DONE, result=result)
+
+    def fail(self, job_id: str, error: str):
+        """
+        Mark a job as failed.
+
+        Args:
+            job_id (str): The job ID.
+            error (str): The error message returned to the client.
+        """
+        self._finish(job_id, FAILED, error=error)
+
+    def get(self, job_id: str):
+        """
+        Get the status of a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            dict: The job's `id`, `status`, `result`, `error` and timestamps,
+            or None if there is no such job.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT id, status, result, error, attempts, created_at, started_at, finished_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return {
+            "id": row[0],
+            "status": row[1],
+            "result": json.loads(row[2]) if row[2] is not None else None,
+            "error": row[3],
+            "attempts": row[4],
+            "created_at": row[5],
+            "started_at": row[6],
+            "finished_at": row[7],
+        }
+
+    def purge(self, older_than: float = DEFAULT_RETENTION_SECONDS) -> int:
+        """
+        Delete the jobs that finished a while ago.
+
+        Args:
+            older_than (float): The age in seconds past which finished jobs
+                are deleted.
+
+        Returns:
+            int: The number of jobs deleted.
+        """
+        def delete(conn):
+            return conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (DONE, FAILED, time.time() - older_than),
+            ).rowcount
+
+        return self._transaction(delete)
+
+    def pending(self) -> int:
+        """
+        Count the queued and running jobs.
+
+        Returns:
+            int: The number of unfinished jobs.
+        """
+        conn = self._connect()
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+
+class JobWorkerPool:
+    """
+    A fixed number of worker threads running the jobs of a JobQueue.
+
+    The threads are started lazily in each process that uses the pool, so a
+    pool created before a server forks still runs in every worker.
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handler,
+        workers: int = 2,
+        poll_interval: float = 1.0,
+        purge_interval: float = 60 * 60,
+    ):
+        """
+        Initialize the JobWorkerPool object.
+
+        Args:
+            queue (JobQueue): The queue to run jobs from.
+            handler (callable): Runs one job: takes its payload and data and
+                returns a JSON-serialisable result.
+            workers (int): The number of jobs run concurrently per process.
+            poll_interval (float): How often idle workers check for jobs
+                submitted by other processes, in seconds.
+            purge_interval (float): How often idle workers delete the jobs
+                past the retention period, in seconds.
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._pid = None
+
+    def ensure_started(self):
+        """
+        Start the worker threads in this process if they are not running yet.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._wakeup = threading.Event()
+            for i in range(self.workers):
+                threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True).start()
+            self._pid = os.getpid()
+
+    def notify(self):
+        """
+        Wake an idle worker after a job was submitted from this process.
+        """
+        self._wakeup.set()
+
+    def _purge(self):
+        now = time.time()
+        with self._lock:
+            if now < self._next_purge:
+                return
+            self._next_purge = now + self.purge_interval
+        try:
+            purged = self.queue.purge()
+        except sqlite3.Error as e:
+            logging.error(f"Error purging finished jobs from {self.queue.path}: {e}")
+            return
+        if purged:
+            logging.info(f"Purged {purged} finished jobs from {self.queue.path}")
+
+    def _run(self):
+        while True:
+            try:
+                job = self.queue.claim()
+            except sqlite3.Error as e:
+                logging.error(f"Error claiming a job from {self.queue.path}: {e}")
+                job = None
+            if job is None:
+                self._purge()
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            try:
+                result = self.handler(job["payload"], job["data"])
+            except Exception as e:
+                logging.error(f"Job {job['id']} failed: {e}", exc_info=True)
+                finish, args = self.queue.fail, (job["id"], str(e))
+            else:
+                finish, args = self.queue.complete, (job["id"], result)
+            try:
+                finish(*args)
+            except Exception as e:
+                # The lease expires and the job is handed out again
+                logging.error(f"Error recording the outcome of job {job['id']}: {e}")
@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+
+from .Utils import PARSER_VERSION, generate_document_id, hash_file
+
+MANIFEST_FILE_NAME = ".manifest.json"
+
+
+class IngestManifest:
+    """
+    A class tracking which source documents have already been parsed, keyed
+    by their content-addressed document ID, so that a run only processes new
+    or changed files.
+    """
+
+    def __init__(self, save_directory: str, file_name: str = MANIFEST_FILE_NAME):
+        """
+        Initialize the IngestManifest object.
+
+        Args:
+            save_directory (str): The directory holding the parsed JSON outputs.
+            file_name (str): The name of the manifest file in that directory.
+        """
+        self.save_directory = save_directory
+        self.manifest_path = os.path.join(save_directory, file_name)
+        self.entries = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.manifest_path) as f:
+                data = json.load(f)
+            return data.get("documents", {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.error(f"Error reading manifest {self.manifest_path}: {e}")
+            return {}
+
+    def plan(self, sources: dict):
+        """
+        Compare the source files against the manifest.
+
+        Args:
+            sources (dict): A dictionary mapping source file names to their paths.
+
+        Returns:
+            tuple: A dictionary mapping the file names to (re)process to their
+            document IDs, and a list of the file names that no longer exist.
+        """
+        to_process = {}
+        for name, path in sources.items():
+            unique_id = generate_document_id(hash_file(path))
+            entry = self.entries.get(name)
+            if (
+                entry is None
+                or entry.get("unique_id") != unique_id
+                or not os.path.isfile(os.path.join(self.save_directory, entry.get("output", "")))
+            ):
+                to_process[name] = unique_id
+        deleted = [name for name in self.entries if name not in sources]
+        return to_process, deleted
+
+    def record(self, name: str, unique_id: str, output_file: str):
+        """
+        Record a parsed document, dropping the output of its previous version.
+
+        Args:
+            name (str): The source file name.
+            unique_id (str): The document ID of the parsed content.
+            output_file (str): The name of the JSON output in the save directory.
+        """
+        previous = self.entries.get(name)
+        if previous is not None and previous.get("output") != output_file:
+            self._remove_output(previous.get("output"))
+        self.entries[name] = {"unique_id": unique_id, "output": output_file}
+
+    def drop(self, name: str):
+        """
+        Forget a source document and delete its JSON output.
+
+        Args:
+            name (str): The source file name.
+        """
+        entry = self.entries.pop(name, None)
+        if entry is not None:
+            self._remove_output(entry.get("output"))
+
+    def clear(self):
+        """
+        Forget every source document without touching the outputs.
+        """
+        self.entries = {}
+
+    def _remove_output(self, output_file):
+        if not output_file:
+            return
+        output_path = os.path.join(self.save_directory, output_file)
+        try:
+            if os.path.isfile(output_path):
+                os.remove(output_path)
+        except Exception as e:
+            logging.error(f"Error deleting {output_path}:\n{e}")
+
+    def save(self):
+        """
+        Write the manifest to disk atomically.
+        """
+        data = {"parser_version": PARSER_VERSION, "documents": self.entries}
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, sort_keys=True, indent=2)
+        os.replace(tmp_path, self.manifest_path)
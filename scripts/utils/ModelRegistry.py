@@ -0,0 +1,112 @@
+import logging
+import os
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_models = {}
+_model_stats = {}
+_lock = threading.RLock()
+
+
+def _current_rss() -> int:
+    """
+    Get the resident set size of the current process.
+
+    Returns:
+        int: The resident set size in bytes, or 0 if it cannot be determined.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        import sys
+
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+    except (ImportError, OSError):
+        return 0
+
+
+def get_model(name: str, loader):
+    """
+    Get a model from the process-wide registry, loading it on first use.
+
+    Every module asking for the same name shares one instance, so each model
+    is held in memory once per process.
+
+    Args:
+        name (str): The key identifying the model.
+        loader (callable): A zero-argument callable returning the loaded model.
+
+    Returns:
+        object: The loaded model.
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+    with _lock:
+        model = _models.get(name)
+        if model is not None:
+            return model
+        rss_before = _current_rss()
+        start = time.perf_counter()
+        model = loader()
+        load_seconds = time.perf_counter() - start
+        rss_bytes = max(_current_rss() - rss_before, 0)
+        _models[name] = model
+        _model_stats[name] = {"load_seconds": load_seconds, "rss_bytes": rss_bytes}
+        logger.info(
+            f"Loaded model {name} in {load_seconds:.2f}s "
+            f"(+{rss_bytes / (1024 * 1024):.1f} MiB RSS)"
+        )
+    return model
+
+
+def get_nlp(name: str = "en_core_web_md"):
+    """
+    Get a spaCy pipeline from the process-wide registry.
+
+    Args:
+        name (str): The name of the spaCy model package.
+
+    Returns:
+        Language: The shared spaCy pipeline.
+    """
+
+    def load():
+        import spacy
+
+        return spacy.load(name)
+
+    return get_model(name, load)
+
+
+def is_loaded(name: str) -> bool:
+    """
+    Check whether a model has already been loaded in this process.
+
+    Args:
+        name (str): The key identifying the model.
+
+    Returns:
+        bool: True if the model is in the registry.
+    """
+    return name in _models
+
+
+def get_model_stats() -> dict:
+    """
+    Get the load time and resident memory growth of every loaded model.
+
+    Returns:
+        dict: A dictionary mapping model names to their `load_seconds` and
+        `rss_bytes`.
+    """
+    with _lock:
+        return {name: dict(stats) for name, stats in _model_stats.items()}
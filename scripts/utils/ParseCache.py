@@ -0,0 +1,148 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+
+from .Utils import PARSER_VERSION
+
+DEFAULT_CACHE_PATH = os.environ.get("PARSE_CACHE_PATH", "data/cache/parse_cache.sqlite3")
+DEFAULT_MAX_BYTES = int(os.environ.get("PARSE_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+def cache_key(namespace: str, *parts: str) -> str:
+    """
+    Build a cache key from a namespace and the values the entry depends on.
+
+    Args:
+        namespace (str): The kind of entry, e.g. "resume" or "keywords".
+        *parts (str): The values identifying the entry, e.g. content hashes.
+
+    Returns:
+        str: The cache key, tied to the current parser version.
+    """
+    digest = hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+    return f"{namespace}:{PARSER_VERSION}:{digest}"
+
+
+class ParseCache:
+    """
+    A disk-backed, size-bounded LRU cache of parse results.
+
+    Entries are stored as JSON in SQLite, which serialises writers across
+    processes, so several workers can share one cache file.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize the ParseCache object.
+
+        Args:
+            path (str): The path of the SQLite database file.
+            max_bytes (int): The total size of stored values above which the
+                least recently used entries are evicted.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, last_access REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)"
+            )
+
+    def _connect(self):
+        # A short-lived connection per call keeps the cache safe to use after fork.
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def get(self, key: str):
+        """
+        Get a cached value and mark it as recently used.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            object: The cached value, or None on a miss.
+        """
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM entries WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+                )
+                return json.loads(row[0])
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error reading parse cache {self.path}: {e}")
+            return None
+
+    def set(self, key: str, value):
+        """
+        Store a value, evicting least recently used entries if over the limit.
+
+        Args:
+            key (str): The cache key.
+            value (object): A JSON-serialisable value.
+        """
+        data = json.dumps(value)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        try:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, value, size, last_access) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, data, size, time.time()),
+                )
+                total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+                while total > self.max_bytes:
+                    oldest = conn.execute(
+                        "SELECT key, size FROM entries ORDER BY last_access LIMIT 1"
+                    ).fetchone()
+                    if oldest is None:
+                        break
+                    conn.execute("DELETE FROM entries WHERE key = ?", (oldest[0],))
+                    total -= oldest[1]
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.error(f"Error writing parse cache {self.path}: {e}")
+
+    def get_or_compute(self, key: str, compute):
+        """
+        Get a cached value, computing and storing it on a miss.
+
+        Args:
+            key (str): The cache key.
+            compute (callable): A zero-argument callable producing the value.
+
+        Returns:
+            object: The cached or freshly computed value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.set(key, value)
+        return value
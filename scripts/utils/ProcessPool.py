@@ -0,0 +1,227 @@
+import concurrent.futures
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+# Each process holds its own copy of the models, so by default every web
+# worker (WEB_CONCURRENCY, as gunicorn counts them) gets an equal share of
+# the CPUs, and at most two processes.
+WEB_WORKERS = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+DEFAULT_WORKERS = int(os.environ.get("SCORE_WORKERS", max(1, min(2, (os.cpu_count() or 1) // WEB_WORKERS))))
+DEFAULT_MAX_PENDING = int(os.environ.get("SCORE_MAX_PENDING", 2 * DEFAULT_WORKERS))
+DEFAULT_TIMEOUT = float(os.environ.get("SCORE_TIMEOUT_SECONDS", 30))
+
+
+class PoolSaturated(Exception):
+    """Raised when a task is submitted while the pool is at capacity."""
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a task does not finish before its deadline."""
+
+
+class PoolUnavailable(Exception):
+    """Raised when the pool's processes could not be started."""
+
+
+def _warm_up():
+    return os.getpid()
+
+
+class WarmProcessPool:
+    """
+    A process pool with a bounded number of admitted tasks.
+
+    The processes are started once per server process and each runs
+    `initializer` once, so tasks never pay for loading models. They are
+    started from a fork server rather than forked from the server process,
+    whose threads may hold locks a forked child would inherit. So each
+    process holds its own copy of the models, and the number of processes
+    is what bounds memory use.
+
+    If the processes cannot be started, e.g. because `initializer` fails,
+    the pool records the error and refuses tasks instead of starting new
+    processes on every call.
+    """
+
+    def __init__(
+        self,
+        initializer=None,
+        workers: int = DEFAULT_WORKERS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Initialize the WarmProcessPool object.
+
+        Args:
+            initializer (callable, optional): Run once in every new process,
+                e.g. to load models.
+            workers (int): The number of processes.
+            max_pending (int): The number of running and waiting tasks above
+                which new tasks are refused.
+            timeout (float): The default deadline of a task, in seconds.
+        """
+        self.initializer = initializer
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+        self._pid = None
+        self.error = None
+
+    def _create_executor(self):
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=context, initializer=self.initializer
+        )
+        # Processes are started on demand, so one task each starts them all
+        warm_ups = [executor.submit(_warm_up) for _ in range(self.workers)]
+        try:
+            for warm_up in warm_ups:
+                warm_up.result()
+        except BrokenProcessPool:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.error = "The scoring processes failed to start"
+            logging.error(f"{self.error}, see the errors logged above")
+            return None
+        logging.info(f"Started {self.workers} scoring processes")
+        return executor
+
+    def ensure_started(self):
+        """
+        Start the processes in this server process if they are not running
+        yet, and wait until every one of them is ready.
+
+        Raises:
+            PoolUnavailable: If the processes could not be started.
+        """
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self.error = None
+                    self._slots = threading.BoundedSemaphore(self.max_pending)
+                    self._executor = self._create_executor()
+                    self._pid = os.getpid()
+        if self.error is not None:
+            raise PoolUnavailable(self.error)
+
+    def status(self) -> dict:
+        """
+        Describe the pool for health checks.
+
+        Returns:
+            dict: Whether the pool is `started` in this process, its number
+            of `workers`, and the `error` that stopped it, if any.
+        """
+        return {
+            "started": self._pid == os.getpid() and self._executor is not None,
+            "workers": self.workers,
+            "error": self.error,
+        }
+
+    def _restart(self, executor):
+        with self._lock:
+            if self._executor is executor and executor is not None:
+                logging.error("A scoring process died, restarting the process pool")
+                executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = self._create_executor()
+
+    def submit(self, fn, *args, admission_timeout: float = None):
+        """
+        Run a task in the pool.
+
+        Args:
+            fn (callable): A picklable, module-level function.
+            *args: Its picklable arguments.
+            admission_timeout (float, optional): How long to wait, in
+                seconds, for a pending task to finish when the pool is at
+                capacity. By default the task is refused at once.
+
+        Returns:
+            concurrent.futures.Future: The future of the task.
+
+        Raises:
+            PoolSaturated: If `max_pending` tasks are still running or waiting.
+            PoolUnavailable: If the processes could not be started.
+        """
+        self.ensure_started()
+        slots = self._slots
+        if admission_timeout is None:
+            admitted = slots.acquire(blocking=False)
+        else:
+            admitted = slots.acquire(timeout=admission_timeout)
+        if not admitted:
+            raise PoolSaturated(f"{self.max_pending} tasks are already pending")
+        executor = self._executor
+        if executor is None:
+            slots.release()
+            raise PoolUnavailable(self.error)
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            slots.release()
+            self._restart(executor)
+            raise
+        except BaseException:
+            slots.release()
+            raise
+        # A slot is only freed once the task is done, not when its caller
+        # gives up, so tasks running past their deadline still count.
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def run(self, fn, *args, timeout: float = None):
+        """
+        Run a task in the pool and wait for its result.
+
+        Args:
+            fn (callable): A picklable, module-level function.
+            *args: Its picklable arguments.
+            timeout (float, optional): The deadline in seconds. Defaults to
+                the pool's timeout.
+
+        Returns:
+            object: The result of the task.
+
+        Raises:
+            PoolSaturated: If `max_pending` tasks are already running or waiting.
+            PoolUnavailable: If the processes could not be started.
+            DeadlineExceeded: If the task does not finish before the deadline.
+        """
+        self.ensure_started()
+        executor = self._executor
+        future = self.submit(fn, *args)
+        try:
+            return self.wait(future, timeout=timeout)
+        except BrokenProcessPool:
+            self._restart(executor)
+            raise
+
+    def wait(self, future, timeout: float = None):
+        """
+        Wait for the result of a task returned by `submit`.
+
+        Args:
+            future (concurrent.futures.Future): The future of the task.
+            timeout (float, optional): The deadline in seconds. Defaults to
+                the pool's timeout.
+
+        Returns:
+            object: The result of the task.
+
+        Raises:
+            DeadlineExceeded: If the task does not finish before the deadline.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            # Drops the task if it is still waiting; a running task finishes.
+            future.cancel()
+            raise DeadlineExceeded(f"Task did not finish within {timeout:g}s") from None
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+import uuid
+
+import docx
+from pypdf import PdfReader
+
+PERSIST_UPLOADS = os.environ.get("PERSIST_UPLOADS", "").lower() in ("1", "true", "yes")
+SPOOL_MAX_BYTES = int(os.environ.get("UPLOAD_SPOOL_MAX_BYTES", 4 * 1024 * 1024))
+RESUMES_DIR = "data/Resumes"
+JOB_DESCRIPTIONS_DIR = "data/JobDescription"
+
+
+class UploadTooLarge(Exception):
+    """Raised when an upload is larger than the size it is limited to."""
+
+
+def read_document(source, file_type: str) -> str:
+    """
+    Extract the text of a PDF or DOCX document.
+
+    Args:
+        source (str | file): The path of the document or a binary stream.
+        file_type (str): Either "pdf" or "docx".
+
+    Returns:
+        str: The text of the document.
+    """
+    if file_type == "pdf":
+        return read_pdf(source)
+    elif file_type == "docx":
+        return read_docx(source)
+    else:
+        raise ValueError("Unsupported file type for document reading.")
+
+
+def read_pdf(source) -> str:
+    text_output = []
+    try:
+        # PdfReader takes a path or a binary stream
+        pdf_reader = PdfReader(source)
+        text_output = [page.extract_text() for page in pdf_reader.pages if page.extract_text()]
+    except Exception as e:
+        print(f"Failed to read PDF file: {str(e)}")
+    return " ".join(text_output)
+
+
+def read_docx(source) -> str:
+    text_output = []
+    try:
+        doc = docx.Document(source)
+        text_output = [para.text for para in doc.paragraphs if para.text]
+    except Exception as e:
+        print(f"Failed to read DOCX file: {str(e)}")
+    return " ".join(text_output)
+
+
+def spool_upload(stream, max_size: int = SPOOL_MAX_BYTES, chunk_size: int = 1 << 20, limit: int = None):
+    """
+    Copy an upload into a buffer that stays in memory unless it is large.
+
+    Args:
+        stream (file): The uploaded file, opened in binary mode.
+        max_size (int): The size above which the buffer spills to a
+            temporary file.
+        chunk_size (int): The number of bytes copied at a time.
+        limit (int, optional): The maximum size of the upload.
+
+    Returns:
+        tuple: The buffer, rewound to its start, and the SHA-256 hex digest
+        of its content.
+
+    Raises:
+        UploadTooLarge: As soon as more than `limit` bytes are read.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=max_size)
+    digest = hashlib.sha256()
+    size = 0
+    for chunk in iter(lambda: stream.read(chunk_size), b""):
+        size += len(chunk)
+        if limit is not None and size > limit:
+            spool.close()
+            raise UploadTooLarge(f"The upload is larger than {limit} bytes")
+        digest.update(chunk)
+        spool.write(chunk)
+    spool.seek(0)
+    return spool, digest.hexdigest()
+
+
+def persist_uploads(resume_bytes: bytes, resume_extension: str, job_description_text: str):
+    """
+    Save an uploaded resume and job description to data/Resumes and
+    data/JobDescription, if enabled with the PERSIST_UPLOADS environment
+    variable.
+
+    Args:
+        resume_bytes (bytes): The uploaded resume.
+        resume_extension (str): The extension of the resume file, e.g. ".pdf".
+        job_description_text (str): The text of the job description.
+
+    Returns:
+        str: The ID in the names of the saved files, or None if uploads are
+        not persisted.
+    """
+    if not PERSIST_UPLOADS:
+        return None
+    unique_id = uuid.uuid4().hex
+    os.makedirs(RESUMES_DIR, exist_ok=True)
+    os.makedirs(JOB_DESCRIPTIONS_DIR, exist_ok=True)
+    with open(os.path.join(RESUMES_DIR, f"{unique_id}_resume{resume_extension}"), "wb") as f:
+        f.write(resume_bytes)
+    with open(os.path.join(JOB_DESCRIPTIONS_DIR, f"{unique_id}_jobdesc.txt"), "w") as f:
+        f.write(job_description_text)
+    return unique_id
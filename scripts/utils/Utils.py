@@ -1,10 +1,11 @@
+import hashlib
 import re
 from uuid import uuid4
 
-import spacy
+from .ModelRegistry import get_nlp
 
-# Load the English model
-nlp = spacy.load("en_core_web_md")
+# Bump whenever parsing changes so content-addressed IDs stop matching old outputs.
+PARSER_VERSION = "1"
 
 REGEX_PATTERNS = {
     "email_pattern": r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b",
@@ -23,6 +24,53 @@ def generate_unique_id():
     return str(uuid4())
 
 
+def hash_bytes(data: bytes) -> str:
+    """
+    Hash raw document content.
+
+    Args:
+        data (bytes): The document content.
+
+    Returns:
+        str: The SHA-256 hex digest of the content.
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Hash the content of a file without loading it into memory at once.
+
+    Args:
+        file_path (str): The path of the file.
+        chunk_size (int): The number of bytes read at a time.
+
+    Returns:
+        str: The SHA-256 hex digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def generate_document_id(content_hash: str) -> str:
+    """
+    Generate a content-addressed ID for a parsed document.
+
+    The same source content parsed by the same parser version always gets
+    the same ID, so parse results can be reused across runs.
+
+    Args:
+        content_hash (str): The hash of the source document content.
+
+    Returns:
+        str: A string with the document ID.
+    """
+    return hashlib.sha256(f"{PARSER_VERSION}:{content_hash}".encode()).hexdigest()[:32]
+
+
 class TextCleaner:
     """
     A class for cleaning a text by removing specific patterns.
@@ -53,7 +101,20 @@ class TextCleaner:
             str: The cleaned text.
         """
         text = TextCleaner.remove_emails_links(text)
-        doc = nlp(text)
+        doc = get_nlp("en_core_web_md")(text)
+        return TextCleaner.remove_punctuation(text, doc)
+
+    def remove_punctuation(text, doc):
+        """
+        Clean the input text by removing the tokens tagged as punctuation.
+
+        Args:
+            text (str): The input text to clean.
+            doc (Doc): The parsed input text.
+
+        Returns:
+            str: The cleaned text.
+        """
         for token in doc:
             if token.pos_ == "PUNCT":
                 text = text.replace(token.text, "")
@@ -69,7 +130,7 @@ class TextCleaner:
         Returns:
             str: The cleaned text.
         """
-        doc = nlp(text)
+        doc = get_nlp("en_core_web_md")(text)
         for token in doc:
             if token.is_stop:
                 text = text.replace(token.text, "")
@@ -78,9 +139,9 @@ class TextCleaner:
 
 class CountFrequency:
 
-    def __init__(self, text):
+    def __init__(self, text, doc=None):
         self.text = text
-        self.doc = nlp(text)
+        self.doc = doc if doc is not None else get_nlp("en_core_web_md")(text)
 
     def count_frequency(self):
         """
@@ -1,3 +1,5 @@
 from .logger import init_logging_config
+from .Manifest import IngestManifest
+from .ModelRegistry import get_model, get_model_stats, get_nlp
 from .ReadFiles import get_filenames_from_dir
 from .Utils import TextCleaner
@@ -1,7 +1,7 @@
+import io
 import os
 import json
 import docx
-import uuid
 import nltk
 import pandas as pd
 import streamlit as st
@@ -10,9 +10,12 @@ from pypdf import PdfReader
 import plotly.graph_objects as go
 from annotated_text import parameters
 from streamlit_extras import add_vertical_space as avs
-from scripts.similarity.get_score import get_score
+from scripts.similarity.cosine_scorer import get_cosine_score
 from scripts.parsers import ParseJobDesc, ParseResume
 from scripts.powerExtract import ResumeJobMatchingSystem, analyze_job_fit_hard_skills, analyze_job_fit_soft_skills
+from scripts.utils.ParseCache import ParseCache, cache_key
+from scripts.utils.Uploads import persist_uploads
+from scripts.utils.Utils import hash_bytes
 
 # Initialize logging and configuration
 from scripts.utils.logger import init_logging_config
@@ -41,33 +44,45 @@ def create_annotated_text(input_string: str, word_list: List[str], annotation: s
             annotated_text.append(token)
     return annotated_text
 
-def read_document(file_path, file_type):
+def read_document(source, file_type):
     if file_type == 'pdf':
-        return read_pdf(file_path)
+        return read_pdf(source)
     elif file_type == 'docx':
-        return read_docx(file_path)
+        return read_docx(source)
     else:
         raise ValueError("Unsupported file type for document reading.")
 
-def read_pdf(file_path):
+def read_pdf(source):
     text_output = []
     try:
-        with open(file_path, "rb") as file:
-            pdf_reader = PdfReader(file)
-            text_output = [page.extract_text() for page in pdf_reader.pages if page.extract_text()]
+        # PdfReader takes a path or a binary stream
+        pdf_reader = PdfReader(source)
+        text_output = [page.extract_text() for page in pdf_reader.pages if page.extract_text()]
     except Exception as e:
         st.error(f"Failed to read PDF file: {str(e)}")
     return " ".join(text_output)
 
-def read_docx(file_path):
+def read_docx(source):
     text_output = []
     try:
-        doc = docx.Document(file_path)
+        doc = docx.Document(source)
         text_output = [para.text for para in doc.paragraphs if para.text]
     except Exception as e:
         st.error(f"Failed to read DOCX file: {str(e)}")
     return " ".join(text_output)
 
+@st.cache_resource
+def get_parse_cache():
+    return ParseCache()
+
+@st.cache_resource
+def get_matching_system():
+    # One matching system, with its taxonomy and soft skills, for every session
+    json_file_path = 'data/job_skills.json'
+    csv_file_path = 'data/job_skills.csv'
+    ss_json_file_path = 'data/soft_skills.json'
+    return ResumeJobMatchingSystem(json_file_path, csv_file_path, ss_json_file_path)
+
 # Streamlit page configuration
 st.set_page_config(page_title="Resume Scorer", layout="wide")
 st.title("Resume Scorer")
@@ -84,33 +99,47 @@ job_description_text = st.sidebar.text_area("Enter your job description here:",
 # Check if all fields are provided
 if st.sidebar.button("Process"):
     if uploaded_resume and job_description_text and company_name and job_title:
-        unique_id = uuid.uuid4().hex
-        resume_filename = f"{unique_id}_resume"
-        jobdesc_filename = f"{unique_id}_jobdesc.txt"
-
-        # Saving the resume file
-        resume_path = os.path.join("data/Resumes", resume_filename + os.path.splitext(uploaded_resume.name)[1])
-        with open(resume_path, "wb") as f:
-            f.write(uploaded_resume.getbuffer())
-        
-        # Saving the job description text
-        job_desc_path = os.path.join("data/JobDescription", jobdesc_filename)
-        with open(job_desc_path, "w") as f:
-            f.write(job_description_text)
-        
-        # Reading and parsing the documents
-        resume_text = read_document(resume_path, uploaded_resume.type.split('/')[-1])
-        resume_data = ParseResume(resume_text).get_JSON()
-        job_desc_data = ParseJobDesc(job_description_text).get_JSON()
+        parse_cache = get_parse_cache()
+        resume_bytes = uploaded_resume.getvalue()
+        resume_hash = hash_bytes(resume_bytes)
+        job_desc_hash = hash_bytes(job_description_text.encode("utf-8"))
+
+        # Keeping a copy of the upload only if PERSIST_UPLOADS is set
+        persist_uploads(resume_bytes, os.path.splitext(uploaded_resume.name)[1], job_description_text)
+
+        # Reading and parsing the documents from memory
+        def parse_resume():
+            file_type = 'docx' if uploaded_resume.name.lower().endswith('.docx') else 'pdf'
+            resume_text = read_document(io.BytesIO(resume_bytes), file_type)
+            return {"text": resume_text, "parsed": ParseResume(resume_text).get_JSON()}
+
+        resume_entry = parse_cache.get_or_compute(cache_key("resume", resume_hash), parse_resume)
+        resume_text = resume_entry["text"]
+        resume_data = resume_entry["parsed"]
+        job_desc_data = parse_cache.get_or_compute(
+            cache_key("jobdesc", job_desc_hash),
+            lambda: ParseJobDesc(job_description_text).get_JSON(),
+        )
         if resume_text and job_description_text:
             st.success("resume and job successfully read.")
-        json_file_path = 'data/job_skills.json'
-        csv_file_path = 'data/job_skills.csv'
-        ss_json_file_path = 'data/soft_skills.json'
-        matching_system = ResumeJobMatchingSystem(json_file_path, csv_file_path, ss_json_file_path)
-        if matching_system.df is not None and matching_system.soft_skills_df is not None:
-            resume_keywords, job_keywords = analyze_job_fit_hard_skills(matching_system, job_title, resume_text, job_description_text) # matching_system, job_title, resume_text, job_text
-            resume_soft_keywords, job_soft_keywords = analyze_job_fit_soft_skills(matching_system, resume_text, job_description_text) # matching_system, resume_text, job_text
+        keywords = None
+        matching_system = get_matching_system()
+        if matching_system.taxonomy is None or matching_system.soft_skills_df is None:
+            # Retry loading the data on the next submit instead of keeping the failure
+            get_matching_system.clear()
+        else:
+            # The analysis depends on the taxonomy, so editing it invalidates it
+            keywords_key = cache_key(
+                "analysis", resume_hash, job_desc_hash, job_title.lower(), matching_system.taxonomy.fingerprint
+            )
+            keywords = parse_cache.get(keywords_key)
+            if keywords is None:
+                resume_keywords, job_keywords = analyze_job_fit_hard_skills(matching_system, job_title, resume_text, job_description_text) # matching_system, job_title, resume_text, job_text
+                resume_soft_keywords, job_soft_keywords = analyze_job_fit_soft_skills(matching_system, resume_text, job_description_text) # matching_system, resume_text, job_text
+                keywords = [resume_keywords, job_keywords, resume_soft_keywords, job_soft_keywords]
+                parse_cache.set(keywords_key, keywords)
+        if keywords is not None:
+            resume_keywords, job_keywords, resume_soft_keywords, job_soft_keywords = keywords
         col1, col2 = st.columns(2)
         with col1:
             st.markdown("### Resume Keywords")
@@ -129,10 +158,8 @@ if st.sidebar.button("Process"):
         resume_advanced_soft_key_words = " ".join(resume_soft_keywords)
         job_advanced_soft_key_words = " ".join(job_soft_keywords)
         st.warning("Calculating similarity score...")
-        result1 = get_score(resume_advanced_key_words, job_advanced_key_words)
-        similarity_score = round(result1[0].score * 100, 2)
-        result2 = get_score(resume_advanced_soft_key_words, job_advanced_soft_key_words)
-        similarity_score_soft = round(result2[0].score * 100, 2)
+        similarity_score = round(get_cosine_score(resume_advanced_key_words, job_advanced_key_words) * 100, 2)
+        similarity_score_soft = round(get_cosine_score(resume_advanced_soft_key_words, job_advanced_soft_key_words) * 100, 2)
         st.success("Processing complete!")
 
         # Display results
@@ -0,0 +1,75 @@
+import random
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from scripts.taxonomy import SkillTaxonomy, get_skill_matcher
+
+TAXONOMY_PATH = "data/job_skills.json"
+
+
+def baseline_process_keywords(optimized_key_words, actual_key_words):
+    # The per-call TF-IDF comparison process_keywords used before SkillMatcher
+    vectors = np.concatenate([np.array([text for text in optimized_key_words]),
+                              np.array([text for text in actual_key_words.keys()])])
+
+    tfidf = TfidfVectorizer()
+    tfidf_matrix = tfidf.fit_transform(vectors).toarray()
+
+    opt_vectors = tfidf_matrix[:len(optimized_key_words)]
+    act_vectors = tfidf_matrix[len(optimized_key_words):]
+
+    opt_norms = np.linalg.norm(opt_vectors, axis=1, keepdims=True) + 1e-10
+    act_norms = np.linalg.norm(act_vectors, axis=1, keepdims=True) + 1e-10
+    similarity_scores = np.dot(opt_vectors, act_vectors.T) / (opt_norms * act_norms.T)
+    advanced_key_words = {}
+    for i, score_row in enumerate(similarity_scores):
+        for j, similarity_score in enumerate(score_row):
+            if similarity_score >= 0.90:
+                act_keyword = list(actual_key_words)[j]
+                advanced_key_words[act_keyword] = actual_key_words[act_keyword]
+    return list(advanced_key_words)
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    return SkillTaxonomy.from_json(TAXONOMY_PATH)
+
+
+def match(taxonomy, keywords, titles):
+    skill_ids = list(dict.fromkeys(
+        skill_id for title in titles for skill_id in taxonomy.skill_ids_for_title(title)
+    ))
+    matched = get_skill_matcher(taxonomy).match(keywords, skill_ids, threshold=0.90)
+    return [taxonomy.skills[skill_id] for skill_id in matched]
+
+
+def test_single_word_does_not_match_longer_skill(taxonomy):
+    # The titles find_job_title_matches returns for "data scientist"
+    titles = ["Data Scientist", "Data Engineer", "IT Security Specialist"]
+    actual = {}
+    for title in titles:
+        for skill in taxonomy.skills_for_title(title):
+            actual[skill] = actual.get(skill, 0) + 1
+    assert baseline_process_keywords(["docker"], actual) == ["Docker"]
+    assert match(taxonomy, ["docker"], titles) == ["Docker"]
+
+
+def test_matches_baseline_on_random_keywords(taxonomy):
+    rng = random.Random(0)
+    words = sorted({word for skill in taxonomy.skills for word in skill.lower().split()})
+    for _ in range(100):
+        titles = rng.sample(taxonomy.titles, rng.randint(1, 3))
+        actual = {}
+        for title in titles:
+            for skill in taxonomy.skills_for_title(title):
+                actual[skill] = actual.get(skill, 0) + 1
+        keywords = [
+            " ".join(rng.sample(words, rng.randint(1, 3))) for _ in range(rng.randint(1, 30))
+        ]
+        keywords += rng.sample(list(actual), min(len(actual), rng.randint(0, 10)))
+        keywords += [skill.lower() + " experience" for skill in rng.sample(list(actual), min(len(actual), 3))]
+        keywords += rng.choices(keywords, k=5)
+        rng.shuffle(keywords)
+        assert match(taxonomy, keywords, titles) == baseline_process_keywords(keywords, actual)
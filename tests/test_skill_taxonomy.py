@@ -0,0 +1,44 @@
+import pytest
+
+from scripts.taxonomy import SkillTaxonomy, load_taxonomy
+
+TAXONOMY_PATH = "data/job_skills.json"
+
+
+@pytest.fixture(scope="module")
+def taxonomy():
+    return SkillTaxonomy.from_json(TAXONOMY_PATH)
+
+
+def test_best_fit_titles_on_snapshot(taxonomy, tmp_path):
+    taxonomy.save(str(tmp_path))
+    snapshot = load_taxonomy(str(tmp_path))
+    skill_ids = snapshot.skill_ids_for_keywords(["docker", "python", "machine learning"])
+    assert snapshot.best_fit_titles(skill_ids) == taxonomy.best_fit_titles(skill_ids)
+    assert snapshot.best_fit_titles(skill_ids)
+
+
+def test_keyword_does_not_count_towards_longer_skills(taxonomy):
+    skill_ids = taxonomy.skill_ids_for_keywords(["docker", "python", "machine learning"])
+    skills = {taxonomy.skills[skill_id] for skill_id in skill_ids}
+    assert "Docker" in skills
+    assert not any(skill.lower() == "docker security" for skill in skills)
+
+    docker_security_titles = {
+        title for title in taxonomy.titles
+        if "docker security" in map(str.lower, taxonomy.skills_for_title(title))
+        and "docker" not in map(str.lower, taxonomy.skills_for_title(title))
+    }
+    assert docker_security_titles
+    docker_ids = taxonomy.skill_ids_for_keywords(["docker"])
+    ranked = taxonomy.best_fit_titles(docker_ids, limit=len(taxonomy))
+    assert not docker_security_titles & {result["title"] for result in ranked}
+
+
+def test_fingerprint_follows_content(taxonomy, tmp_path):
+    taxonomy.save(str(tmp_path / "snapshot"))
+    assert load_taxonomy(str(tmp_path / "snapshot")).fingerprint == taxonomy.fingerprint
+
+    records = taxonomy.to_records()
+    records[0]["skills"].append("Docker Security")
+    assert SkillTaxonomy.from_records(records).fingerprint != taxonomy.fingerprint
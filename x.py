@@ -41,7 +41,7 @@ json_file_path = 'data/job_skills.json'
 csv_file_path = 'data/job_skills.csv'
 ss_json_file_path = 'data/soft_skills.json'
 matching_system = ResumeJobMatchingSystem(json_file_path, csv_file_path, ss_json_file_path)
-if matching_system.df is not None and matching_system.soft_skills_df is not None:
+if matching_system.taxonomy is not None and matching_system.soft_skills_df is not None:
     resume_keywords, job_keywords = analyze_job_fit_hard_skills(matching_system)
     resume_soft_keywords, job_soft_keywords = analyze_job_fit_soft_skills(matching_system)
 